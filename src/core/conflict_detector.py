@@ -1,12 +1,109 @@
 """DBPF parser for conflict detection in .package files."""
 
 import logging
+import mmap
+import os
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from struct import unpack
-from typing import Optional
+from struct import Struct
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# DBPF header prefix: magic, version, (skipped), index position @36, index count @40
+HEADER = Struct("<4sI28xII")
+
+# DBPF index entry: type (u32), group (u32), instance (u64), position + size (skipped)
+INDEX_ENTRY = Struct("<IIQ8x")
+
+
+@dataclass(frozen=True, eq=False)
+class ResourceId:
+    """DBPF resource key (type, group, instance) with a memoized hash.
+
+    Tuple hashes are recomputed on every dict/set probe, so the hash is
+    calculated once at construction. Instances hash and compare equal to the
+    equivalent ``(type_id, group_id, instance_id)`` tuple, so plain tuples
+    can still be used for lookups.
+
+    Attributes:
+        type_id: Resource type (32-bit)
+        group_id: Resource group (32-bit)
+        instance_id: Resource instance (64-bit)
+    """
+
+    # Declared by hand (not slots=True): Python 3.10 has no weakref_slot, and
+    # the intern table needs __weakref__
+    __slots__ = ("type_id", "group_id", "instance_id", "_hash", "__weakref__")
+
+    type_id: int
+    group_id: int
+    instance_id: int
+
+    def __post_init__(self) -> None:
+        """Compute and cache the tuple-compatible hash."""
+        object.__setattr__(
+            self, "_hash", hash((self.type_id, self.group_id, self.instance_id))
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResourceId):
+            return (
+                self._hash == other._hash
+                and self.type_id == other.type_id
+                and self.group_id == other.group_id
+                and self.instance_id == other.instance_id
+            )
+        if isinstance(other, tuple):
+            return (self.type_id, self.group_id, self.instance_id) == other
+        return NotImplemented
+
+    def __iter__(self) -> Iterator[int]:
+        """Allow unpacking as ``type_id, group_id, instance_id``."""
+        yield self.type_id
+        yield self.group_id
+        yield self.instance_id
+
+    def __reduce__(self) -> tuple:
+        """Pickle and copy through the intern table.
+
+        Frozen instances with hand-written slots cannot be restored by the
+        default slot-state protocol, and routing through the intern table
+        keeps unpickled keys shared.
+        """
+        return (_intern_resource_id, ((self.type_id, self.group_id, self.instance_id),))
+
+
+# Canonical ResourceId per key, shared by every package that contains it.
+# Held weakly: an entry disappears once no cached parse or resource map uses it
+_RESOURCE_IDS: "weakref.WeakValueDictionary[tuple[int, int, int], ResourceId]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _intern_resource_id(key: tuple[int, int, int]) -> ResourceId:
+    """Return the shared ResourceId for a (type, group, instance) key.
+
+    Resources overridden by many mods then cost one object instead of one
+    per package.
+
+    Args:
+        key: (type_id, group_id, instance_id) tuple
+
+    Returns:
+        Interned ResourceId
+    """
+    resource_id = _RESOURCE_IDS.get(key)
+    if resource_id is None:
+        resource_id = _RESOURCE_IDS[key] = ResourceId(*key)
+    return resource_id
+
 
 class DBPFParser:
     """Parse Sims 4 .package files (DBPF format) for resource IDs."""
@@ -14,14 +111,14 @@ class DBPFParser:
     DBPF_MAGIC = b"DBPF"  # File signature
 
     @staticmethod
-    def parse_package(path: Path) -> set[tuple[int, int, int]]:
+    def parse_package(path: Path) -> set[ResourceId]:
         """Extract resource IDs from .package file.
 
         Args:
             path: Path to .package file
 
         Returns:
-            Set of (type_id, group_id, instance_id) tuples
+            Set of ResourceId keys
 
         Raises:
             ValueError: If file is not valid DBPF format
@@ -31,37 +128,63 @@ class DBPFParser:
             raise FileNotFoundError(f"Package file not found: {path}")
 
         with open(path, "rb") as f:
-            # Verify DBPF header
-            magic = f.read(4)
-            if magic != DBPFParser.DBPF_MAGIC:
+            # Empty files cannot be mapped (and have no magic)
+            if os.fstat(f.fileno()).st_size == 0:
                 raise ValueError(f"Invalid .package file (bad magic): {path}")
 
-            # Read header
-            version = unpack("<I", f.read(4))[0]
-            logger.debug(f"DBPF version: {version}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Reject non-DBPF files before touching anything past the magic
+                if mm[:4] != DBPFParser.DBPF_MAGIC:
+                    raise ValueError(f"Invalid .package file (bad magic): {path}")
+                if len(mm) < HEADER.size:
+                    raise ValueError(f"Truncated .package header: {path}")
 
-            # Skip to index position (offset 36)
-            f.seek(36)
-            index_pos = unpack("<I", f.read(4))[0]
-            index_count = unpack("<I", f.read(4))[0]
+                _, version, index_pos, index_count = HEADER.unpack_from(mm)
+                logger.debug(f"DBPF version: {version}")
 
-            logger.debug(f"Index: {index_count} entries at position {index_pos}")
+                logger.debug(f"Index: {index_count} entries at position {index_pos}")
 
-            # Jump to resource index
-            f.seek(index_pos)
-            resources: set[tuple[int, int, int]] = set()
+                index_end = index_pos + index_count * INDEX_ENTRY.size
+                if index_end > len(mm):
+                    raise ValueError(f"Truncated resource index: {path}")
 
-            for _ in range(index_count):
-                type_id = unpack("<I", f.read(4))[0]
-                group_id = unpack("<I", f.read(4))[0]
-                instance_id = unpack("<Q", f.read(8))[0]  # 64-bit
+                # Decode the index straight from the mapping (no read copy);
+                # iter_unpack walks all entries in C
+                with memoryview(mm)[index_pos:index_end] as index_view:
+                    return {
+                        _intern_resource_id(key)
+                        for key in INDEX_ENTRY.iter_unpack(index_view)
+                    }
 
-                resources.add((type_id, group_id, instance_id))
 
-                # Skip position and size fields
-                f.read(8)
+@lru_cache(maxsize=4096)
+def _parse_package_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> frozenset[ResourceId]:
+    """Parse a package, memoized on its path and stat fingerprint.
 
-            return resources
+    ``mtime_ns`` and ``size`` are part of the cache key so an edited file is
+    re-parsed rather than served stale.
+
+    Args:
+        path_str: Path to .package file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Frozen set of resource IDs
+    """
+    return frozenset(DBPFParser.parse_package(Path(path_str)))
+
+
+def clear_parse_cache() -> None:
+    """Drop every memoized package parse.
+
+    The cache key relies on mtime, which FAT/exFAT and some network shares
+    record at coarse granularity, so a same-size rewrite can look unchanged.
+    Full scans call this to start from the files on disk.
+    """
+    _parse_package_cached.cache_clear()
 
 
 class ConflictDetector:
@@ -69,11 +192,14 @@ class ConflictDetector:
 
     def __init__(self) -> None:
         """Initialize conflict detector."""
-        self.resource_map: dict[tuple[int, int, int], list[str]] = {}
+        self.resource_map: defaultdict[ResourceId, list[str]] = defaultdict(list)
 
-    def scan_mod(self, mod_path: Path) -> Optional[set[tuple[int, int, int]]]:
+    def scan_mod(self, mod_path: Path) -> Optional[frozenset[ResourceId]]:
         """Scan single mod for resource IDs.
 
+        Results are cached by (path, mtime, size), so repeated scans of an
+        unchanged file across build_resource_map/check_mod_conflicts are free.
+
         Args:
             mod_path: Path to .package file
 
@@ -85,7 +211,8 @@ class ConflictDetector:
             return None
 
         try:
-            resources = DBPFParser.parse_package(mod_path)
+            st = mod_path.stat()
+            resources = _parse_package_cached(str(mod_path), st.st_mtime_ns, st.st_size)
             logger.debug(f"Found {len(resources)} resources in {mod_path.name}")
             return resources
         except Exception as e:
@@ -95,9 +222,14 @@ class ConflictDetector:
     def build_resource_map(self, mods: list[Path]) -> None:
         """Build map of resources to mods.
 
+        A full rebuild re-parses every package rather than trusting cached
+        parses (see clear_parse_cache); later scan_mod calls reuse the
+        fresh results.
+
         Args:
             mods: List of mod file paths
         """
+        clear_parse_cache()
         self.resource_map.clear()
 
         for mod_path in mods:
@@ -105,10 +237,10 @@ class ConflictDetector:
             if resources is None:
                 continue
 
+            resource_map = self.resource_map
+            mod_name = mod_path.name
             for resource_id in resources:
-                if resource_id not in self.resource_map:
-                    self.resource_map[resource_id] = []
-                self.resource_map[resource_id].append(mod_path.name)
+                resource_map[resource_id].append(mod_name)
 
     def get_conflicts(self) -> dict[str, list[str]]:
         """Get conflicts (resources touched by multiple mods).
@@ -116,14 +248,13 @@ class ConflictDetector:
         Returns:
             Dictionary mapping resource IDs to conflicting mod names
         """
-        conflicts: dict[str, list[str]] = {}
-
-        for resource_id, mod_names in self.resource_map.items():
-            if len(mod_names) > 1:
-                # Format resource ID as hex string
-                type_id, group_id, instance_id = resource_id
-                resource_str = f"{type_id:08X}_{group_id:08X}_{instance_id:016X}"
-                conflicts[resource_str] = mod_names
+        # Single pass: filter and format resource IDs as hex strings together.
+        # Keys are unpacked so plain (type, group, instance) tuples also work
+        conflicts = {
+            f"{type_id:08X}_{group_id:08X}_{instance_id:016X}": mod_names
+            for (type_id, group_id, instance_id), mod_names in self.resource_map.items()
+            if len(mod_names) > 1
+        }
 
         logger.info(f"Found {len(conflicts)} resource conflicts")
         return conflicts
@@ -136,27 +267,19 @@ class ConflictDetector:
             existing_mods: List of currently installed mods
 
         Returns:
-            List of conflicting mod names
+            List of conflicting mod names, in ``existing_mods`` order
         """
         new_resources = self.scan_mod(mod_path)
         if new_resources is None:
             return []
 
-        # Build resource map from existing mods
-        existing_resources: dict[tuple[int, int, int], str] = {}
+        # C-level set check per existing mod, stopping at the first shared resource
+        conflicts: list[str] = []
         for existing_mod in existing_mods:
             resources = self.scan_mod(existing_mod)
-            if resources:
-                for resource_id in resources:
-                    existing_resources[resource_id] = existing_mod.name
-
-        # Find conflicts
-        conflicts = []
-        for resource_id in new_resources:
-            if resource_id in existing_resources:
-                conflicting_mod = existing_resources[resource_id]
-                if conflicting_mod not in conflicts:
-                    conflicts.append(conflicting_mod)
+            if resources and not new_resources.isdisjoint(resources):
+                if existing_mod.name not in conflicts:
+                    conflicts.append(existing_mod.name)
 
         if conflicts:
             logger.warning(
@@ -6,13 +6,22 @@ multiple deployment methods (junction/symlink/copy), and verification.
 
 import ctypes
 import logging
+import mmap
 import os
+import re
 import shutil
+import stat
 import subprocess
+import sys
+import tarfile
+import threading
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Generator, Optional
+from typing import Callable, Generator, Optional, Union
 
 import zlib
 
@@ -23,7 +32,57 @@ from src.utils.process_manager import GameProcessManager
 logger = logging.getLogger(__name__)
 
 # Deployment method preference order
-DEPLOYMENT_METHODS = ["junction", "symlink", "copy"]
+DEPLOYMENT_METHODS = ["junction", "symlink", "hardlink", "copy"]
+
+# Supported backup archive formats ("zip" is the default; "tar" is an
+# uncompressed, strictly sequential stream)
+BACKUP_FORMATS = ["zip", "tar"]
+
+# Zip compression for files that are not already compressed (configs,
+# scripts); packages are always stored
+BACKUP_COMPRESSIONS = (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED)
+
+# Platform checks, evaluated once at import
+_IS_WINDOWS = os.name == "nt"
+_IS_LINUX = sys.platform.startswith("linux")
+
+# Reparse tag of NTFS mount points/junctions (stat only exports it on Windows)
+_IO_REPARSE_TAG_MOUNT_POINT = getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", 0xA0000003)
+
+# Binary-mode flag for os.open (only meaningful on Windows)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# File suffixes the game loads as mods (tuple for str.endswith)
+MOD_FILE_EXTENSIONS = (".package", ".ts4script")
+
+# Already-compressed formats stored as-is in zip backups (tuple for str.endswith)
+PRECOMPRESSED_EXTENSIONS = (".package", ".ts4script", ".zip")
+
+# Files up to this size are read whole and added with writestr in backups
+BACKUP_INLINE_MAX_SIZE = 256 * 1024
+
+# Small-file reads kept in flight ahead of the zip writer (bounds memory to
+# BACKUP_READ_AHEAD * BACKUP_INLINE_MAX_SIZE)
+BACKUP_READ_AHEAD = 64
+
+# Buffer size for streaming file contents (backups, buffered copies)
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Minimum seconds between progress callbacks within one step (per-file copy
+# updates); step changes and completion are always reported
+PROGRESS_MIN_INTERVAL = 0.05
+
+# Worker threads for file copies (I/O bound; overlapping requests fills SSD queues)
+COPY_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# File types compared during deployment verification (tuple for str.endswith)
+VERIFY_EXTENSIONS = (".package", ".ts4script", ".py")
+
+# Files up to this size are hashed from plain reads instead of a mapping
+HASH_MMAP_THRESHOLD = 256 * 1024
+
+# Worker threads for hashing during verification (I/O bound, GIL released on read)
+VERIFY_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
 
 # resource.cfg template
 RESOURCE_CFG_TEMPLATE = """Priority 1000
@@ -35,6 +94,16 @@ DirectoryFiles Mods/ActiveMods/*/*/*/*.package
 DirectoryFiles Mods/ActiveMods/*/*/*/*/*.package
 """
 
+# Pre-encoded resource.cfg contents written on every deploy
+RESOURCE_CFG_BYTES = RESOURCE_CFG_TEMPLATE.encode("utf-8")
+
+# Required resource.cfg directives, each at the start of a line: a numeric
+# Priority followed by a DirectoryFiles entry pointing into ActiveMods
+RESOURCE_CFG_PATTERN = re.compile(
+    rb"^[ \t]*Priority[ \t]+\d+\b.*?^[ \t]*DirectoryFiles[ \t]+[^\n]*ActiveMods",
+    re.M | re.S,
+)
+
 
 class DeployEngine:
     """ACID-compliant mod deployment engine with transactional rollback.
@@ -49,17 +118,53 @@ class DeployEngine:
         ...     )
     """
 
-    def __init__(self, backup_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        backup_dir: Optional[Path] = None,
+        backup_format: str = "zip",
+        backup_compression: int = zipfile.ZIP_DEFLATED,
+    ) -> None:
         """Initialize deployment engine.
 
         Args:
             backup_dir: Directory for backups (auto-detect if None)
+            backup_format: Backup archive format, one of BACKUP_FORMATS
+            backup_compression: Zip compression for non-package files, one of
+                BACKUP_COMPRESSIONS (ZIP_STORED skips zlib entirely)
+
+        Raises:
+            ValueError: If backup_format or backup_compression is not supported
         """
+        if backup_format not in BACKUP_FORMATS:
+            raise ValueError(
+                f"Unsupported backup format: {backup_format} "
+                f"(expected one of {', '.join(BACKUP_FORMATS)})"
+            )
+        if backup_compression not in BACKUP_COMPRESSIONS:
+            raise ValueError(f"Unsupported backup compression: {backup_compression}")
+
         self.backup_dir = backup_dir
+        self.backup_format = backup_format
+        self.backup_compression = backup_compression
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear per-deployment state so the engine can be reused.
+
+        Configuration (backup_dir, backup_format) is kept. A process manager
+        still held is exited before it is dropped.
+        """
+        process_manager = getattr(self, "_process_manager", None)
+        if process_manager is not None:
+            process_manager.__exit__(None, None, None)
+
         self._backup_path: Optional[Path] = None
         self._deployed_path: Optional[Path] = None
         self._in_transaction = False
         self._deployment_method: Optional[str] = None
+        self._last_progress_time = float("-inf")
+        self._last_progress_step: Optional[str] = None
+        self._process_manager: Optional[GameProcessManager] = None
 
     def transaction(self):
         """Context manager for transactional deployment.
@@ -87,6 +192,10 @@ class DeployEngine:
                 except Exception as e:
                     logger.error(f"Rollback failed: {e}")
 
+        if self._process_manager is not None:
+            self._process_manager.__exit__(exc_type, exc_val, exc_tb)
+            self._process_manager = None
+
         self._in_transaction = False
         logger.info("=== END DEPLOYMENT TRANSACTION ===")
 
@@ -148,13 +257,24 @@ class DeployEngine:
         # Step 5: Remove old ActiveMods link/folder if exists
         self._report_progress(progress_callback, "Cleaning old deployment", 50.0)
         deployed_active = game_mods_path / "ActiveMods"
-        if deployed_active.exists():
-            self._remove_deployment(deployed_active)
+        self._remove_deployment(deployed_active)
 
         # Step 6: Deploy with fallback methods
         self._report_progress(progress_callback, "Deploying mods", 60.0)
         self._deployed_path = deployed_active
-        success = self._deploy_with_fallback(active_mods_path, deployed_active)
+
+        def file_progress(done: int, total: int) -> None:
+            # Copy deployments advance through 60-80% one file at a time;
+            # _report_progress throttles the per-file updates
+            self._report_progress(
+                progress_callback, "Deploying mods", 60.0 + 20.0 * done / total
+            )
+
+        success = self._deploy_with_fallback(
+            active_mods_path,
+            deployed_active,
+            file_progress if progress_callback else None,
+        )
 
         if not success:
             raise DeployError(
@@ -188,7 +308,7 @@ class DeployEngine:
             game_mods_path: Path to Mods folder
 
         Returns:
-            Path to backup zip file
+            Path to backup archive (.zip or .tar per backup_format)
         """
         if self.backup_dir is None:
             # Auto-detect backup directory
@@ -198,17 +318,15 @@ class DeployEngine:
 
         # Generate timestamped backup name
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        backup_path = self.backup_dir / f"backup_{timestamp}.zip"
+        backup_path = self.backup_dir / f"backup_{timestamp}.{self.backup_format}"
 
         logger.info(f"Creating backup: {backup_path}")
 
         try:
-            with zipfile.ZipFile(backup_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                if game_mods_path.exists():
-                    for file_path in game_mods_path.rglob("*"):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(game_mods_path.parent)
-                            zf.write(file_path, arcname)
+            if self.backup_format == "tar":
+                self._write_tar_backup(backup_path, game_mods_path)
+            else:
+                self._write_zip_backup(backup_path, game_mods_path)
 
             logger.info(f"Backup complete: {backup_path.stat().st_size} bytes")
             return backup_path
@@ -219,6 +337,105 @@ class DeployEngine:
                 recovery_hint="Check disk space and permissions",
             ) from e
 
+    def _write_zip_backup(self, backup_path: Path, game_mods_path: Path) -> None:
+        """Write Mods folder into a zip archive.
+
+        Already-compressed files (PRECOMPRESSED_EXTENSIONS: packages, scripts,
+        zips) are stored as-is; everything else is deflated at level 1 unless
+        backup_compression is ZIP_STORED.
+
+        Args:
+            backup_path: Archive to create
+            game_mods_path: Path to Mods folder
+        """
+        # .package files are DBPF containers whose resources are already
+        # compressed (and .ts4script files are zips), so store those and
+        # stream large ones in big chunks; configs and other loose files get
+        # cheap level-1 deflate
+        with zipfile.ZipFile(
+            backup_path, "w", zipfile.ZIP_STORED, allowZip64=True
+        ) as zf:
+            if not game_mods_path.exists():
+                return
+
+            def write_inline(
+                zinfo: zipfile.ZipInfo, deflate: bool, data: Future
+            ) -> None:
+                if deflate:
+                    zf.writestr(
+                        zinfo,
+                        data.result(),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                        compresslevel=1,
+                    )
+                else:
+                    zf.writestr(zinfo, data.result())
+
+            root = os.fspath(game_mods_path)
+            # scandir paths extend the walk root verbatim, so arcnames
+            # are built by slicing rather than os.path.relpath per file
+            root_len = len(os.path.join(root, ""))
+            arc_prefix = os.path.join(game_mods_path.name, "")
+
+            # Small files are read on a thread pool with a bounded window
+            # of reads in flight, keeping the disk queue full while this
+            # thread (the only one touching the ZipFile) writes entries
+            with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+                pending: deque[tuple[zipfile.ZipInfo, bool, Future]] = deque()
+                for entry in _iter_files(root):
+                    arcname = arc_prefix + entry.path[root_len:]
+                    zinfo = _zipinfo_from_entry(entry, arcname)
+                    deflate = (
+                        self.backup_compression == zipfile.ZIP_DEFLATED
+                        and not entry.name.lower().endswith(PRECOMPRESSED_EXTENSIONS)
+                    )
+
+                    if zinfo.file_size <= BACKUP_INLINE_MAX_SIZE:
+                        # Small files (most scripts and CC): one read, one
+                        # writestr, no chunked copy loop
+                        pending.append(
+                            (zinfo, deflate, executor.submit(_read_file, entry.path))
+                        )
+                        if len(pending) >= BACKUP_READ_AHEAD:
+                            write_inline(*pending.popleft())
+                        continue
+
+                    if deflate:
+                        zf.write(
+                            entry.path,
+                            arcname,
+                            compress_type=zipfile.ZIP_DEFLATED,
+                            compresslevel=1,
+                        )
+                        continue
+
+                    with open(entry.path, "rb") as src, zf.open(
+                        zinfo, "w", force_zip64=True
+                    ) as dst:
+                        shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+                while pending:
+                    write_inline(*pending.popleft())
+
+    def _write_tar_backup(self, backup_path: Path, game_mods_path: Path) -> None:
+        """Write Mods folder into an uncompressed tar stream.
+
+        Unlike zip there is no central directory to seek back and patch, so
+        the archive is written in one sequential pass.
+
+        Args:
+            backup_path: Archive to create
+            game_mods_path: Path to Mods folder
+        """
+        with tarfile.open(backup_path, "w") as tf:
+            if game_mods_path.exists():
+                root = os.fspath(game_mods_path)
+                root_len = len(os.path.join(root, ""))
+                arc_prefix = os.path.join(game_mods_path.name, "")
+                for entry in _iter_files(root):
+                    arcname = arc_prefix + entry.path[root_len:]
+                    tf.add(entry.path, arcname=arcname, recursive=False)
+
     def _validate_active_mods(self, active_mods_path: Path) -> None:
         """Validate ActiveMods folder structure and file integrity.
 
@@ -234,18 +451,19 @@ class DeployEngine:
                 recovery_hint="Run SCAN to rebuild ActiveMods",
             )
 
-        # Check for at least one mod file
-        mod_files = list(active_mods_path.rglob("*.package")) + list(
-            active_mods_path.rglob("*.ts4script")
+        # Check for at least one mod file, stopping the walk at the first hit
+        has_mods = any(
+            entry.name.lower().endswith(MOD_FILE_EXTENSIONS)
+            for entry in _iter_files(os.fspath(active_mods_path))
         )
 
-        if not mod_files:
+        if not has_mods:
             raise PathError(
                 "No mod files found in ActiveMods",
                 recovery_hint="Add mods to ActiveMods folder first",
             )
 
-        logger.debug(f"Validated {len(mod_files)} mod files")
+        logger.debug(f"Validated ActiveMods: {active_mods_path}")
 
     def generate_resource_cfg(self, game_mods_path: Path) -> Path:
         """Generate resource.cfg with DirectoryFiles patterns.
@@ -264,15 +482,27 @@ class DeployEngine:
         try:
             game_mods_path.mkdir(parents=True, exist_ok=True)
 
-            with open(cfg_path, "w", encoding="utf-8") as f:
-                f.write(RESOURCE_CFG_TEMPLATE)
+            # Write a temp file and rename it over resource.cfg, so the game
+            # never sees a missing or half-written config
+            tmp_path = game_mods_path / f".resource.cfg.{os.getpid()}.tmp"
+            try:
+                fd = os.open(
+                    tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644
+                )
+                try:
+                    view = memoryview(RESOURCE_CFG_BYTES)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, cfg_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
             logger.info(f"Generated resource.cfg: {cfg_path}")
 
-            # Validate syntax
-            if not self._validate_resource_cfg_syntax(cfg_path):
-                raise DeployError("Generated resource.cfg has invalid syntax")
-
             return cfg_path
 
         except Exception as e:
@@ -291,12 +521,8 @@ class DeployEngine:
             True if syntax is valid
         """
         try:
-            with open(cfg_path, "r") as f:
-                content = f.read()
-
-            # Check for required directives
-            required = ["Priority", "DirectoryFiles"]
-            if not all(directive in content for directive in required):
+            # Single precompiled regex sweep for all required directives
+            if RESOURCE_CFG_PATTERN.search(cfg_path.read_bytes()) is None:
                 logger.warning("resource.cfg missing required directives")
                 return False
 
@@ -309,33 +535,75 @@ class DeployEngine:
     def _close_game_safely(self) -> None:
         """Close game processes with user confirmation.
 
+        Inside a transaction the transaction's shared manager is used;
+        otherwise a short-lived manager is entered and exited here.
+
         Raises:
             DeployError: If game cannot be closed
         """
+        if self._in_transaction:
+            self._close_game_with(self._get_process_manager())
+            return
+
         with GameProcessManager() as gpm:
-            if not gpm.is_game_running():
-                logger.debug("Game not running, skipping close")
-                return
+            self._close_game_with(gpm)
 
-            logger.info("Closing game processes")
+    def _close_game_with(self, gpm: GameProcessManager) -> None:
+        """Close game processes using an already-entered process manager.
 
-            if not gpm.close_game_safely(timeout=10):
-                raise DeployError(
-                    "Failed to close game",
-                    recovery_hint="Manually close game and retry",
-                )
+        Args:
+            gpm: Entered GameProcessManager
+
+        Raises:
+            DeployError: If game cannot be closed
+        """
+        if not gpm.is_game_running():
+            logger.debug("Game not running, skipping close")
+            return
+
+        logger.info("Closing game processes")
+
+        if not gpm.close_game_safely(timeout=10):
+            raise DeployError(
+                "Failed to close game",
+                recovery_hint="Manually close game and retry",
+            )
+
+    def _get_process_manager(self) -> GameProcessManager:
+        """Return the transaction's process manager, creating it on first use.
+
+        One manager is kept until the transaction exits, so repeated deploys
+        reuse it and the processes it terminated stay on record. Only call
+        this while a transaction is active; ``__exit__`` releases it.
+
+        Returns:
+            Entered GameProcessManager
+        """
+        if self._process_manager is None:
+            self._process_manager = GameProcessManager().__enter__()
+        return self._process_manager
 
-    def _deploy_with_fallback(self, source: Path, target: Path) -> bool:
+    def _deploy_with_fallback(
+        self,
+        source: Path,
+        target: Path,
+        file_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> bool:
         """Deploy using fallback method chain.
 
         Args:
             source: Source ActiveMods folder
             target: Target deployment location
+            file_progress: Optional callback(files_done, files_total) for
+                the per-file copy method
 
         Returns:
             True if any method succeeded
         """
         for method in DEPLOYMENT_METHODS:
+            if method == "junction" and not _IS_WINDOWS:
+                continue  # Junctions are an NTFS feature
+
             try:
                 logger.info(f"Attempting deployment method: {method}")
 
@@ -349,8 +617,13 @@ class DeployEngine:
                         self._deployment_method = "symlink"
                         return True
 
+                elif method == "hardlink":
+                    if self._create_hardlinks(source, target):
+                        self._deployment_method = "hardlink"
+                        return True
+
                 elif method == "copy":
-                    if self._copy_files(source, target):
+                    if self._copy_files(source, target, file_progress):
                         self._deployment_method = "copy"
                         return True
 
@@ -370,7 +643,7 @@ class DeployEngine:
         Returns:
             True if successful
         """
-        if os.name != "nt":
+        if not _IS_WINDOWS:
             logger.debug("Junctions only supported on Windows")
             return False
 
@@ -422,18 +695,108 @@ class DeployEngine:
             logger.warning(f"Symlink creation error: {e}")
             return False
 
-    def _copy_files(self, source: Path, target: Path) -> bool:
+    def _create_hardlinks(self, source: Path, target: Path) -> bool:
+        """Mirror the source tree with hard-linked files.
+
+        Only directory entries are written, so no file data moves. Works
+        without the privileges symlinks need on Windows, but only within
+        one volume; a partial tree is removed on failure so the copy
+        fallback starts clean.
+
+        Args:
+            source: Source directory
+            target: Target directory
+
+        Returns:
+            True if successful
+        """
+        source_root = os.fspath(source)
+        target_root = os.fspath(target)
+        try:
+            os.makedirs(target_root)  # Fails if target already exists
+        except OSError as e:
+            logger.warning(f"Hardlink deployment failed: {e}")
+            return False
+
+        try:
+            # Links cannot cross volumes; compare devices up front rather
+            # than failing on the first os.link
+            if os.stat(source_root).st_dev != os.stat(target_root).st_dev:
+                logger.info("Source and target are on different volumes, skipping hardlinks")
+                os.rmdir(target_root)
+                return False
+
+            stack = [(source_root, target_root)]
+            while stack:
+                src_dir, dst_dir = stack.pop()
+                with os.scandir(src_dir) as it:
+                    for entry in it:
+                        dst_path = os.path.join(dst_dir, entry.name)
+                        if entry.is_dir(follow_symlinks=False):
+                            os.mkdir(dst_path)
+                            stack.append((entry.path, dst_path))
+                        elif entry.is_file():
+                            os.link(entry.path, dst_path)
+
+            logger.info(f"Hardlinks created: {target} -> {source}")
+            return True
+
+        except OSError as e:
+            # EXDEV (different volume), unsupported filesystem, permissions
+            logger.warning(f"Hardlink deployment failed: {e}")
+            shutil.rmtree(target_root, ignore_errors=True)
+            return False
+
+    def _copy_files(
+        self,
+        source: Path,
+        target: Path,
+        file_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> bool:
         """Copy files (fallback method).
 
         Args:
             source: Source directory
             target: Target directory
+            file_progress: Optional callback(files_done, files_total), called
+                on this thread as each copy completes
 
         Returns:
             True if successful
         """
         try:
-            shutil.copytree(source, target, dirs_exist_ok=False)
+            source_root = os.fspath(source)
+            target_root = os.fspath(target)
+            os.makedirs(target_root)  # Fails if target already exists
+
+            # Walk with scandir, mirroring directories as they are discovered
+            # (parents exist before their files are queued) and overlapping
+            # file copies on a thread pool to keep the disk queue busy
+            with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+                futures = []
+                stack = [(source_root, target_root)]
+                while stack:
+                    src_dir, dst_dir = stack.pop()
+                    with os.scandir(src_dir) as it:
+                        for entry in it:
+                            dst_path = os.path.join(dst_dir, entry.name)
+                            if entry.is_dir(follow_symlinks=False):
+                                os.mkdir(dst_path)
+                                stack.append((entry.path, dst_path))
+                            elif entry.is_file():
+                                futures.append(
+                                    executor.submit(_copy_file, entry.path, dst_path)
+                                )
+
+                # Surface the first copy error, dropping queued work
+                total = len(futures)
+                for done, future in enumerate(as_completed(futures), 1):
+                    if future.exception() is not None:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        future.result()
+                    if file_progress is not None:
+                        file_progress(done, total)
+
             logger.info(f"Files copied: {source} -> {target}")
             return True
 
@@ -448,12 +811,22 @@ class DeployEngine:
             deployed_path: Path to remove
         """
         try:
-            if deployed_path.is_symlink() or deployed_path.is_junction():
+            # One lstat answers existence, link and directory questions, and
+            # (unlike exists()) still sees a dangling link
+            try:
+                st = os.lstat(deployed_path)
+            except FileNotFoundError:
+                return
+
+            if (
+                stat.S_ISLNK(st.st_mode)
+                or getattr(st, "st_reparse_tag", 0) == _IO_REPARSE_TAG_MOUNT_POINT
+            ):
                 # Remove link without following
                 os.unlink(deployed_path)
                 logger.info(f"Removed link: {deployed_path}")
-            elif deployed_path.is_dir():
-                shutil.rmtree(deployed_path)
+            elif stat.S_ISDIR(st.st_mode):
+                _remove_tree(os.fspath(deployed_path))
                 logger.info(f"Removed directory: {deployed_path}")
 
         except Exception as e:
@@ -472,39 +845,90 @@ class DeployEngine:
         logger.info("Verifying deployment integrity")
 
         try:
-            # Get all mod files from source
-            source_files = {}
-            for file_path in source.rglob("*"):
-                if file_path.is_file() and file_path.suffix in [
-                    ".package",
-                    ".ts4script",
-                    ".py",
-                ]:
-                    rel_path = file_path.relative_to(source)
-                    source_files[rel_path] = self._hash_file(file_path)
-
-            # Compare with target
-            for rel_path, source_hash in source_files.items():
-                target_file = target / rel_path
-
-                if not target_file.exists():
-                    logger.error(f"Missing file in deployment: {rel_path}")
+            # List both trees once, keyed by path relative to their root
+            # (scandir paths extend the walk root verbatim)
+            source_root = os.fspath(source)
+            target_root = os.fspath(target)
+            source_len = len(os.path.join(source_root, ""))
+            target_len = len(os.path.join(target_root, ""))
+            target_files = {
+                entry.path[target_len:]: entry
+                for entry in _iter_files(target_root)
+                if entry.name.endswith(VERIFY_EXTENSIONS)
+            }
+
+            # Pair every source file with its deployed copy; missing files
+            # fail before any data is read
+            pairs = []
+            for entry in _iter_files(source_root):
+                if not entry.name.endswith(VERIFY_EXTENSIONS):
+                    continue
+                target_entry = target_files.get(entry.path[source_len:])
+                if target_entry is None:
+                    logger.error(
+                        f"Missing file in deployment: "
+                        f"{os.path.join(target_root, entry.path[source_len:])}"
+                    )
                     return False
+                pairs.append((entry, target_entry))
+
+            # Check source/target pairs concurrently, stopping at first failure
+            with ThreadPoolExecutor(max_workers=VERIFY_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(self._verify_file, source_entry, target_entry)
+                    for source_entry, target_entry in pairs
+                ]
+                for future in as_completed(futures):
+                    if not future.result():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        return False
+
+            logger.info(f"Verified {len(pairs)} files successfully")
+            return True
+
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return False
 
-                target_hash = self._hash_file(target_file)
+    def _verify_file(
+        self, source_entry: os.DirEntry, target_entry: os.DirEntry
+    ) -> bool:
+        """Compare one deployed file against its source.
 
-                if source_hash != target_hash:
-                    logger.error(f"Hash mismatch for {rel_path}")
-                    return False
+        The same file (hardlink or link deployments) is accepted outright,
+        and differing sizes fail without reading any data. Every other pair
+        is hashed in full: copies carry their source's mtime (copystat), so
+        size + mtime would accept a torn or corrupted copy unread.
+
+        Args:
+            source_entry: Source file entry from the scandir walk
+            target_entry: Corresponding deployed file entry
 
-            logger.info(f"Verified {len(source_files)} files successfully")
+        Returns:
+            True if the target file matches the source
+        """
+        # DirEntry.stat() leaves st_ino/st_dev zero on Windows but inode()
+        # is filled on every platform; confirm the device with a full stat
+        # only for pairs whose inodes already match
+        source_ino = source_entry.inode()
+        if (
+            source_ino
+            and source_ino == target_entry.inode()
+            and os.path.samestat(os.stat(source_entry.path), os.stat(target_entry.path))
+        ):
             return True
 
-        except Exception as e:
-            logger.error(f"Verification failed: {e}")
+        if source_entry.stat().st_size != target_entry.stat().st_size:
+            logger.error(f"Size mismatch for {target_entry.path}")
+            return False
+
+        if self._hash_file(source_entry.path) != self._hash_file(target_entry.path):
+            logger.error(f"Hash mismatch for {target_entry.path}")
             return False
 
-    def _hash_file(self, path: Path) -> int:
+        return True
+
+    def _hash_file(self, path: Union[str, Path]) -> int:
         """Calculate CRC32 hash of file.
 
         Args:
@@ -513,8 +937,23 @@ class DeployEngine:
         Returns:
             CRC32 hash value
         """
-        with open(path, "rb") as f:
-            return zlib.crc32(f.read())
+        fd = os.open(path, os.O_RDONLY | _O_BINARY)
+        try:
+            if os.fstat(fd).st_size <= HASH_MMAP_THRESHOLD:
+                # Small files (and empty ones, which cannot be mapped): a
+                # read or two is cheaper than setting up and tearing down a
+                # mapping
+                crc = 0
+                while chunk := os.read(fd, HASH_MMAP_THRESHOLD):
+                    crc = zlib.crc32(chunk, crc)
+                return crc
+
+            # Hash the mapped file in one C call: no read copies, no Python
+            # chunk loop, and zlib releases the GIL for the worker threads
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return zlib.crc32(mm)
+        finally:
+            os.close(fd)
 
     def _validate_game_accessibility(self, game_mods_path: Path) -> None:
         """Validate that Mods folder is accessible by game.
@@ -546,7 +985,7 @@ class DeployEngine:
         """Rollback deployment from backup.
 
         Args:
-            backup_path: Path to backup zip
+            backup_path: Path to backup archive (.zip or .tar)
             deployed_path: Path to deployed ActiveMods
 
         Raises:
@@ -556,13 +995,19 @@ class DeployEngine:
 
         try:
             # Remove deployed ActiveMods
-            if deployed_path.exists():
-                self._remove_deployment(deployed_path)
-
-            # Restore from backup
-            with zipfile.ZipFile(backup_path, "r") as zf:
-                mods_parent = deployed_path.parent
-                zf.extractall(mods_parent)
+            self._remove_deployment(deployed_path)
+
+            # Restore from backup (archive entries are rooted at "Mods/...")
+            mods_parent = deployed_path.parent.parent
+            if backup_path.suffix == ".tar":
+                with tarfile.open(backup_path, "r") as tf:
+                    if hasattr(tarfile, "data_filter"):
+                        # Reject absolute paths, links out of tree, devices
+                        tf.extractall(mods_parent, filter="data")
+                    else:
+                        tf.extractall(mods_parent)
+            else:
+                self._extract_zip_backup(backup_path, mods_parent)
 
             logger.info("Rollback complete")
 
@@ -572,13 +1017,71 @@ class DeployEngine:
                 recovery_hint=f"Manually restore from {backup_path}",
             ) from e
 
+    def _extract_zip_backup(self, backup_path: Path, dest_root: Path) -> None:
+        """Extract a zip backup, writing file entries concurrently.
+
+        Directories are created up front so workers never race on makedirs.
+        A ZipFile handle must not be read from several threads at once, so
+        each worker opens its own.
+
+        Args:
+            backup_path: Zip archive to extract
+            dest_root: Directory the archive entries are rooted at
+        """
+        root = os.fspath(dest_root)
+        local = threading.local()
+        handles: list[zipfile.ZipFile] = []
+
+        def extract_member(info: zipfile.ZipInfo, dst_path: str) -> None:
+            zf = getattr(local, "zf", None)
+            if zf is None:
+                zf = local.zf = zipfile.ZipFile(backup_path, "r")
+                handles.append(zf)
+            with zf.open(info) as src, open(dst_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+        try:
+            with zipfile.ZipFile(backup_path, "r") as zf:
+                members = []
+                created_dirs = set()
+                for info in zf.infolist():
+                    dst_path = _zip_member_path(root, info.filename)
+                    if dst_path is None:
+                        continue
+                    dst_dir = dst_path if info.is_dir() else os.path.dirname(dst_path)
+                    if dst_dir not in created_dirs:
+                        os.makedirs(dst_dir, exist_ok=True)
+                        created_dirs.add(dst_dir)
+                    if not info.is_dir():
+                        members.append((info, dst_path))
+
+            with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(extract_member, info, dst_path)
+                    for info, dst_path in members
+                ]
+
+                # Surface the first extraction error, dropping queued work
+                for future in as_completed(futures):
+                    if future.exception() is not None:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        future.result()
+        finally:
+            for handle in handles:
+                handle.close()
+
     def _report_progress(
         self,
         callback: Optional[Callable[[str, float], None]],
         step: str,
         percentage: float,
     ) -> None:
-        """Report progress to callback.
+        """Report progress to callback, throttled to PROGRESS_MIN_INTERVAL.
+
+        Repeated updates for the same step arriving faster than the interval
+        are dropped (the next one through carries the latest state). A new
+        step, 0% and 100% are always delivered, so the UI never shows a
+        stale step while a long operation runs.
 
         Args:
             callback: Progress callback function
@@ -586,14 +1089,214 @@ class DeployEngine:
             percentage: Progress percentage (0-100)
         """
         if callback:
-            try:
-                callback(step, percentage)
-            except Exception as e:
-                logger.warning(f"Progress callback failed: {e}")
+            now = time.monotonic()
+            if (
+                percentage >= 100.0
+                or percentage <= 0.0
+                or step != self._last_progress_step
+                or now - self._last_progress_time >= PROGRESS_MIN_INTERVAL
+            ):
+                self._last_progress_time = now
+                self._last_progress_step = step
+                try:
+                    callback(step, percentage)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
 
         logger.debug(f"Progress: {step} ({percentage:.1f}%)")
 
 
+def _iter_files(root: str) -> Generator[os.DirEntry, None, None]:
+    """Recursively yield file entries under root using os.scandir.
+
+    DirEntry caches the file type from the directory listing, so this avoids
+    the per-entry Path allocation and stat() calls of ``Path.rglob``.
+    Directory symlinks are not descended into.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        DirEntry for each file
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file.
+
+    Args:
+        path: File path
+
+    Returns:
+        File contents
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _zipinfo_from_entry(entry: os.DirEntry, arcname: str) -> zipfile.ZipInfo:
+    """Build a stored-entry ZipInfo from a scandir entry.
+
+    Equivalent to ``ZipInfo.from_file`` but reuses the stat result cached on
+    the DirEntry (free on Windows, where it comes with the directory
+    listing) instead of stat-ing the file again.
+
+    Args:
+        entry: File entry from the scandir walk
+        arcname: Name of the entry inside the archive
+
+    Returns:
+        ZipInfo with size, timestamp and mode filled in (ZIP_STORED)
+    """
+    st = entry.stat()
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    zinfo.compress_type = zipfile.ZIP_STORED
+    return zinfo
+
+
+def _zip_member_path(root: str, name: str) -> Optional[str]:
+    """Map a zip member name to a path under root.
+
+    Mirrors the sanitizing done by ``ZipFile.extract``: drive letters and
+    empty, ``.`` and ``..`` components are dropped so entries cannot escape
+    root.
+
+    Args:
+        root: Extraction directory
+        name: Archive member name
+
+    Returns:
+        Destination path, or None if nothing of the name remains
+    """
+    name = os.path.splitdrive(name.replace("/", os.sep))[1]
+    parts = [part for part in name.split(os.sep) if part not in ("", ".", "..")]
+    if not parts:
+        return None
+    return os.path.join(root, *parts)
+
+
+def _remove_tree(root: str) -> None:
+    """Delete a directory tree, unlinking files on a thread pool.
+
+    The tree is listed once with scandir, files are unlinked concurrently
+    (each unlink is an independent metadata syscall), then directories are
+    removed deepest first. Links and junctions are removed, never followed.
+
+    Args:
+        root: Directory to delete
+
+    Raises:
+        OSError: If any entry cannot be removed
+    """
+    files = []
+    dirs = [root]  # Parents always precede their children
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    files.append(entry.path)
+                    continue
+
+                dirs.append(entry.path)
+                # Junctions look like directories; remove without descending
+                reparse_tag = getattr(entry.stat(follow_symlinks=False), "st_reparse_tag", 0)
+                if reparse_tag != _IO_REPARSE_TAG_MOUNT_POINT:
+                    stack.append(entry.path)
+
+    if files:
+        with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+            for _ in executor.map(os.unlink, files):
+                pass  # Re-raises the first failure
+
+    for path in reversed(dirs):
+        os.rmdir(path)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int) -> None:
+    """Move as much data as possible between descriptors inside the kernel.
+
+    Tries ``os.copy_file_range`` first, then ``os.sendfile`` (Linux accepts
+    file-to-file sendfile, and older kernels refuse cross-device
+    copy_file_range). Both advance the file offsets, so any remainder can be
+    finished by a plain read/write loop.
+
+    Args:
+        src_fd: Source descriptor (at offset 0)
+        dst_fd: Destination descriptor (at offset 0)
+    """
+    remaining = os.fstat(src_fd).st_size
+    copiers = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(("copy_file_range", os.copy_file_range))
+    if _IS_LINUX:
+        copiers.append(
+            ("sendfile", lambda in_fd, out_fd, count: os.sendfile(out_fd, in_fd, None, count))
+        )
+
+    for name, copier in copiers:
+        try:
+            while remaining > 0:
+                copied = copier(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    return
+                remaining -= copied
+            return
+        except OSError as e:
+            logger.debug(f"{name} unavailable ({e}), trying next copy method")
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """Copy file contents in-kernel where possible, then copy metadata.
+
+    On Windows this is a single ``CopyFileW`` call. Elsewhere it works
+    directly on OS file descriptors (no buffered file objects), moving data
+    with ``_kernel_copy`` and finishing any remainder with a 1 MiB
+    ``os.read``/``os.write`` loop.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        Destination path
+    """
+    if _IS_WINDOWS:
+        # CopyFileW copies data, attributes and timestamps in one call
+        if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            raise ctypes.WinError()
+        return dst
+
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+        try:
+            _kernel_copy(src_fd, dst_fd)
+
+            # Copies whatever the kernel copy did not (file offsets were advanced)
+            while chunk := os.read(src_fd, STREAM_CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(dst_fd, view) :]
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
 # Utility to check if path is junction
 def _is_junction(path: Path) -> bool:
     """Check if path is a Windows junction.
@@ -604,14 +1307,18 @@ def _is_junction(path: Path) -> bool:
     Returns:
         True if path is junction
     """
-    if os.name != "nt":
+    if not _IS_WINDOWS:
         return False
 
     try:
-        return path.exists() and path.is_dir() and path.is_symlink()
-    except Exception:
+        # One lstat: the reparse tag identifies mount points (junctions)
+        # without following them or stat-ing the path three times
+        st = os.lstat(path)
+    except OSError:
         return False
 
+    return getattr(st, "st_reparse_tag", 0) == _IO_REPARSE_TAG_MOUNT_POINT
+
 
 # Add is_junction helper to Path
 Path.is_junction = lambda self: _is_junction(self)
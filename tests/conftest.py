@@ -14,6 +14,8 @@ from unittest.mock import Mock
 
 import pytest
 
+from tests.helpers import GameProcessManagerStub
+
 
 # =============================================================================
 # LOGGING
@@ -419,6 +421,25 @@ def mock_game_process() -> Mock:
     return process
 
 
+@pytest.fixture
+def game_process_manager_stub(
+    monkeypatch: pytest.MonkeyPatch,
+) -> GameProcessManagerStub:
+    """Patch DeployEngine's GameProcessManager with a stub.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        Stub returned by ``with GameProcessManager() as gpm``
+    """
+    stub = GameProcessManagerStub()
+    monkeypatch.setattr(
+        "src.core.deploy_engine.GameProcessManager", lambda *args, **kwargs: stub
+    )
+    return stub
+
+
 # =============================================================================
 # PLATFORM FIXTURES
 # =============================================================================
@@ -1,11 +1,64 @@
 """Tests for DBPF conflict detection."""
 
+import copy
+import os
+import pickle
 import pytest
 from pathlib import Path
-from struct import pack
-from src.core.conflict_detector import ConflictDetector, DBPFParser
+from struct import Struct, pack
+from unittest.mock import patch
+from src.core.conflict_detector import (
+    _RESOURCE_IDS,
+    ConflictDetector,
+    DBPFParser,
+    ResourceId,
+    _intern_resource_id,
+    clear_parse_cache,
+)
 from src.core.mod_scanner import ModFile
 
+# Magic, version, padding, index position (offset 36), index count (offset 40), padding
+_HEADER_STRUCT = Struct("<4sI28xII52x")
+_INDEX_ENTRY_STRUCT = Struct("<IIQII")
+
+
+class TestResourceId:
+    """Test ResourceId key behaviour."""
+    
+    def test_equals_and_hashes_like_tuple(self):
+        """Test ResourceId is interchangeable with the equivalent tuple."""
+        key = ResourceId(0x12345678, 0x00000000, 0xABCDEF1234567890)
+        as_tuple = (0x12345678, 0x00000000, 0xABCDEF1234567890)
+        
+        assert key == as_tuple
+        assert hash(key) == hash(as_tuple)
+        assert as_tuple in {key}
+        assert {key: "mod1.package"}[as_tuple] == "mod1.package"
+        assert tuple(key) == as_tuple
+    
+    def test_distinct_keys_not_equal(self):
+        """Test keys differing in any component are not equal."""
+        key = ResourceId(1, 2, 3)
+        
+        assert key == ResourceId(1, 2, 3)
+        assert key != ResourceId(1, 2, 4)
+        assert key != (1, 2)
+    
+    def test_immutable(self):
+        """Test ResourceId cannot be mutated."""
+        key = ResourceId(1, 2, 3)
+        
+        with pytest.raises(AttributeError):
+            key.type_id = 5
+    
+    def test_pickle_and_copy_round_trip(self):
+        """Test pickled and copied keys come back as the interned instance."""
+        key = _intern_resource_id((1, 2, 3))
+        
+        assert pickle.loads(pickle.dumps(key)) is key
+        assert copy.copy(key) is key
+        assert copy.deepcopy({key: ["mod1.package"]}) == {key: ["mod1.package"]}
+
 
 class TestDBPFParser:
     """Test DBPF file parsing."""
@@ -61,6 +114,31 @@ class TestDBPFParser:
         assert (0x12345678, 0x00000000, 0xABCDEF1234567890) in resources
         assert (0x87654321, 0x11111111, 0x1111222233334444) in resources
     
+    def test_parse_interns_resource_ids(self, tmp_path):
+        """Test the same resource in two packages shares one ResourceId."""
+        header = _HEADER_STRUCT.pack(b"DBPF", 2, 96, 1)
+        entry = _INDEX_ENTRY_STRUCT.pack(0x0BADF00D, 0, 0x1234, 200, 100)
+        
+        first = tmp_path / "first.package"
+        second = tmp_path / "second.package"
+        first.write_bytes(header + entry)
+        second.write_bytes(header + entry)
+        
+        (rid_a,) = DBPFParser.parse_package(first)
+        (rid_b,) = DBPFParser.parse_package(second)
+        
+        assert rid_a is rid_b
+
+    def test_interned_ids_released_when_unused(self):
+        """Test the intern table does not keep unreferenced ResourceIds alive."""
+        key = (0x0BADF00D, 0xFFFFFFFF, 0x5678)
+        rid = _intern_resource_id(key)
+        assert _RESOURCE_IDS[key] is rid
+
+        del rid
+
+        assert key not in _RESOURCE_IDS
+    
     def test_parse_invalid_magic(self, tmp_path):
         """Test parsing file with invalid magic."""
         invalid_file = tmp_path / "invalid.package"
@@ -69,11 +147,35 @@ class TestDBPFParser:
         with pytest.raises(ValueError, match="Invalid .package file"):
             DBPFParser.parse_package(invalid_file)
     
+    def test_parse_zero_byte_file(self, tmp_path):
+        """Test parsing an empty file is rejected as invalid."""
+        empty_file = tmp_path / "zero.package"
+        empty_file.write_bytes(b"")
+        
+        with pytest.raises(ValueError, match="Invalid .package file"):
+            DBPFParser.parse_package(empty_file)
+    
     def test_parse_nonexistent_file(self, tmp_path):
         """Test parsing nonexistent file."""
         with pytest.raises(FileNotFoundError):
             DBPFParser.parse_package(tmp_path / "nonexistent.package")
     
+    def test_parse_truncated_index(self, tmp_path):
+        """Test parsing package whose index is shorter than declared."""
+        package_file = tmp_path / "truncated.package"
+        
+        header = bytearray(96)
+        header[0:4] = b"DBPF"
+        header[4:8] = pack("<I", 2)  # Version
+        header[36:40] = pack("<I", 96)  # Index position (at offset 36)
+        header[40:44] = pack("<I", 2)  # Claims 2 entries, only 1 present
+        
+        entry = pack("<IIQII", 0x12345678, 0, 0xABCDEF1234567890, 200, 100)
+        package_file.write_bytes(bytes(header) + entry)
+        
+        with pytest.raises(ValueError, match="Truncated resource index"):
+            DBPFParser.parse_package(package_file)
+    
     def test_parse_empty_package(self, tmp_path):
         """Test parsing package with no resources."""
         package_file = tmp_path / "empty.package"
@@ -105,22 +207,15 @@ class TestConflictDetector:
         """Factory fixture to create DBPF packages."""
         def _create(path: Path, resource_ids: list[tuple[int, int, int]]):
             """Create DBPF package with specified resource IDs."""
-            header = bytearray(96)
-            header[0:4] = b"DBPF"
-            header[4:8] = pack("<I", 2)  # Version
-            header[36:40] = pack("<I", 96)  # Index position (at offset 36)
-            header[40:44] = pack("<I", len(resource_ids))  # Index count (at offset 40)
+            header = _HEADER_STRUCT.pack(b"DBPF", 2, 96, len(resource_ids))
             
-            # Create index entries
-            index_data = b""
-            for type_id, group_id, instance_id in resource_ids:
-                index_data += pack("<I", type_id)
-                index_data += pack("<I", group_id)
-                index_data += pack("<Q", instance_id)
-                index_data += pack("<I", 200)  # Position
-                index_data += pack("<I", 100)  # Size
+            # Create index entries (type, group, instance, position, size)
+            index_data = b"".join(
+                _INDEX_ENTRY_STRUCT.pack(type_id, group_id, instance_id, 200, 100)
+                for type_id, group_id, instance_id in resource_ids
+            )
             
-            path.write_bytes(bytes(header) + index_data)
+            path.write_bytes(header + index_data)
         
         return _create
     
@@ -146,6 +241,63 @@ class TestConflictDetector:
         assert len(resources) == 1
         assert (0x12345678, 0x00000000, 0xABCDEF1234567890) in resources
     
+    def test_scan_mod_cached_until_file_changes(self, detector, tmp_path, create_dbpf_package):
+        """Test repeated scans reuse results until the file changes."""
+        package = tmp_path / "mod1.package"
+        resource_a = (0x11111111, 0x00000000, 0x1111111111111111)
+        resource_b = (0x22222222, 0x00000000, 0x2222222222222222)
+        create_dbpf_package(package, [resource_a])
+        
+        with patch.object(
+            DBPFParser, "parse_package", wraps=DBPFParser.parse_package
+        ) as parse:
+            first = detector.scan_mod(package)
+            second = ConflictDetector().scan_mod(package)
+            
+            assert first == second == {resource_a}
+            assert parse.call_count == 1
+            
+            # Size change invalidates the cache entry
+            create_dbpf_package(package, [resource_a, resource_b])
+            
+            assert detector.scan_mod(package) == {resource_a, resource_b}
+            assert parse.call_count == 2
+    
+    def test_build_resource_map_reparses_after_same_stat_rewrite(
+        self, detector, tmp_path, create_dbpf_package
+    ):
+        """Test a full scan sees a rewrite that kept the same size and mtime."""
+        package = tmp_path / "mod1.package"
+        resource_a = (0x11111111, 0x00000000, 0x1111111111111111)
+        resource_b = (0x22222222, 0x00000000, 0x2222222222222222)
+        create_dbpf_package(package, [resource_a])
+        st = package.stat()
+        assert detector.scan_mod(package) == {resource_a}
+        
+        # Same-size rewrite within a coarse mtime tick
+        create_dbpf_package(package, [resource_b])
+        os.utime(package, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert detector.scan_mod(package) == {resource_a}
+        
+        detector.build_resource_map([package])
+        
+        assert dict(detector.resource_map) == {resource_b: ["mod1.package"]}
+    
+    def test_clear_parse_cache_forces_reparse(self, detector, tmp_path, create_dbpf_package):
+        """Test clearing the parse cache makes the next scan re-read the file."""
+        package = tmp_path / "mod1.package"
+        create_dbpf_package(package, [(0x1, 0x2, 0x3)])
+        detector.scan_mod(package)
+        
+        with patch.object(
+            DBPFParser, "parse_package", wraps=DBPFParser.parse_package
+        ) as parse:
+            detector.scan_mod(package)
+            clear_parse_cache()
+            detector.scan_mod(package)
+        
+        assert parse.call_count == 1
+    
     def test_scan_mod_non_package_file(self, detector, tmp_path):
         """Test scanning non-package file."""
         txt_file = tmp_path / "readme.txt"
@@ -237,6 +389,31 @@ class TestConflictDetector:
         # Resource B conflict
         assert any(set(mods) == {"mod2.package", "mod3.package"} for mods in conflict_mods)
     
+    def test_conflict_keys_formatted_as_hex(self, detector, tmp_path, create_dbpf_package):
+        """Test conflict keys are zero-padded hex resource IDs."""
+        mod1 = tmp_path / "mod1.package"
+        mod2 = tmp_path / "mod2.package"
+        
+        same_resource = (0x0000ABCD, 0x00000001, 0x00000000DEADBEEF)
+        
+        create_dbpf_package(mod1, [same_resource])
+        create_dbpf_package(mod2, [same_resource])
+        
+        detector.build_resource_map([mod1, mod2])
+        conflicts = detector.get_conflicts()
+        
+        assert conflicts == {
+            "0000ABCD_00000001_00000000DEADBEEF": ["mod1.package", "mod2.package"]
+        }
+    
+    def test_get_conflicts_accepts_tuple_keys(self, detector):
+        """Test plain tuple keys in the resource map are formatted too."""
+        detector.resource_map = {(0x1, 0x2, 0x3): ["mod1.package", "mod2.package"]}
+        
+        assert detector.get_conflicts() == {
+            "00000001_00000002_0000000000000003": ["mod1.package", "mod2.package"]
+        }
+    
     def test_detect_conflicts_three_way(self, detector, tmp_path, create_dbpf_package):
         """Test three-way conflict detection."""
         mod1 = tmp_path / "mod1.package"
@@ -273,3 +450,21 @@ class TestConflictDetector:
         assert len(conflicts) == 2  # Conflicts with both mod2 and mod3
         assert "mod2.package" in conflicts
         assert "mod3.package" in conflicts
+    
+    def test_check_mod_conflicts_shared_resource(self, detector, tmp_path, create_dbpf_package):
+        """Test every existing mod sharing a resource is reported."""
+        new_mod = tmp_path / "new.package"
+        mod1 = tmp_path / "mod1.package"
+        mod2 = tmp_path / "mod2.package"
+        mod3 = tmp_path / "mod3.package"
+        
+        shared = (0x11111111, 0x00000000, 0x1111111111111111)
+        
+        create_dbpf_package(new_mod, [shared])
+        create_dbpf_package(mod1, [shared])
+        create_dbpf_package(mod2, [(0x22222222, 0x00000000, 0x2222222222222222)])
+        create_dbpf_package(mod3, [shared])
+        
+        conflicts = detector.check_mod_conflicts(new_mod, [mod1, mod2, mod3])
+        
+        assert conflicts == ["mod1.package", "mod3.package"]
@@ -1,18 +1,29 @@
 """Tests for deployment engine."""
 
 import os
+import shutil
 import zipfile
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from src.core.deploy_engine import (
+    BACKUP_INLINE_MAX_SIZE,
+    BACKUP_READ_AHEAD,
     DEPLOYMENT_METHODS,
+    HASH_MMAP_THRESHOLD,
+    RESOURCE_CFG_BYTES,
+    RESOURCE_CFG_PATTERN,
     RESOURCE_CFG_TEMPLATE,
+    STREAM_CHUNK_SIZE,
     DeployEngine,
+    _is_junction,
+    _iter_files,
 )
 from src.core.exceptions import DeployError, HashValidationError, PathError
+from tests.helpers import GameProcessManagerStub
 
 
 @pytest.fixture
@@ -25,17 +36,21 @@ def engine() -> DeployEngine:
     return DeployEngine()
 
 
-@pytest.fixture
-def active_mods(tmp_path: Path) -> Path:
-    """Create mock ActiveMods folder with test files.
+@pytest.fixture(scope="session")
+def active_mods_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create read-only mock ActiveMods folder once per session.
+
+    Tests that only read the tree use this directly; tests that modify it
+    must use ``active_mods``. Files are chmod 0o444 so an accidental
+    in-place write fails instead of leaking into later tests.
 
     Args:
-        tmp_path: Pytest tmp_path fixture
+        tmp_path_factory: Pytest tmp_path_factory fixture
 
     Returns:
-        Path to ActiveMods folder
+        Path to template ActiveMods folder
     """
-    active = tmp_path / "ActiveMods"
+    active = tmp_path_factory.mktemp("active_mods_template") / "ActiveMods"
     active.mkdir()
 
     # Create test mod files
@@ -43,6 +58,28 @@ def active_mods(tmp_path: Path) -> Path:
     (active / "subfolder").mkdir()
     (active / "subfolder" / "another_mod.package").write_bytes(b"DBPF" + b"\x00" * 50)
 
+    for path in active.rglob("*.package"):
+        path.chmod(0o444)
+
+    return active
+
+
+@pytest.fixture
+def active_mods(tmp_path: Path, active_mods_template: Path) -> Path:
+    """Create writable mock ActiveMods folder copied from the template.
+
+    Only file contents are copied, so the copies are writable even though
+    the template files are read-only.
+
+    Args:
+        tmp_path: Pytest tmp_path fixture
+        active_mods_template: Session-scoped template tree
+
+    Returns:
+        Path to ActiveMods folder
+    """
+    active = tmp_path / "ActiveMods"
+    shutil.copytree(active_mods_template, active, copy_function=shutil.copyfile)
     return active
 
 
@@ -78,6 +115,32 @@ class TestDeployEngine:
 
         assert engine.backup_dir == backup_dir
 
+    def test_reset_clears_deployment_state(self, tmp_path: Path) -> None:
+        """Test reset clears transaction state but keeps configuration."""
+        engine = DeployEngine(backup_dir=tmp_path)
+        engine._backup_path = tmp_path / "backup.zip"
+        engine._deployed_path = tmp_path / "ActiveMods"
+        engine._in_transaction = True
+        engine._deployment_method = "copy"
+
+        engine.reset()
+
+        assert engine._backup_path is None
+        assert engine._deployed_path is None
+        assert engine._in_transaction is False
+        assert engine._deployment_method is None
+        assert engine.backup_dir == tmp_path
+
+    def test_initialization_rejects_unknown_backup_format(self) -> None:
+        """Test unsupported backup formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported backup format"):
+            DeployEngine(backup_format="rar")
+
+    def test_initialization_rejects_unknown_backup_compression(self) -> None:
+        """Test unsupported zip compression methods are rejected."""
+        with pytest.raises(ValueError, match="Unsupported backup compression"):
+            DeployEngine(backup_compression=zipfile.ZIP_LZMA)
+
     def test_transaction_context_manager(self, engine: DeployEngine) -> None:
         """Test transaction context manager."""
         assert not engine._in_transaction
@@ -109,6 +172,165 @@ class TestDeployEngine:
             namelist = zf.namelist()
             assert any("existing_mod.package" in name for name in namelist)
 
+    def test_backup_stores_without_compression(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test backup stores already-compressed packages as-is."""
+        (game_mods / "existing_mod.package").write_bytes(b"DBPF" + b"\x00" * 100)
+        engine.backup_dir = tmp_path / "backups"
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        with zipfile.ZipFile(backup_path, "r") as zf:
+            infos = zf.infolist()
+            assert infos
+            assert all(info.compress_type == zipfile.ZIP_STORED for info in infos)
+            assert zf.read(infos[0]) == b"DBPF" + b"\x00" * 100
+
+    def test_backup_entry_metadata_matches_source(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test stored entries carry the same metadata as ZipInfo.from_file."""
+        package = game_mods / "existing_mod.package"
+        package.write_bytes(b"DBPF" + b"\x01" * 50)
+        os.utime(package, (1_700_000_000, 1_700_000_000))  # Even: zip has 2s resolution
+        engine.backup_dir = tmp_path / "backups"
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        expected = zipfile.ZipInfo.from_file(package, "Mods/existing_mod.package")
+        with zipfile.ZipFile(backup_path, "r") as zf:
+            info = zf.getinfo("Mods/existing_mod.package")
+            assert info.date_time == expected.date_time
+            assert info.external_attr == expected.external_attr
+            assert info.file_size == expected.file_size
+
+    def test_backup_streams_large_files(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test packages larger than one stream chunk round-trip intact."""
+        data = b"DBPF" + os.urandom(STREAM_CHUNK_SIZE * 2 + 123)
+        (game_mods / "big.package").write_bytes(data)
+        engine.backup_dir = tmp_path / "backups"
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        with zipfile.ZipFile(backup_path, "r") as zf:
+            assert zf.testzip() is None
+            info = zf.getinfo("Mods/big.package")
+            assert info.file_size == len(data)
+            assert zf.read(info) == data
+
+    def test_backup_deflates_uncompressed_files(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test non-package files are deflated in the backup."""
+        (game_mods / "resource.cfg").write_text(RESOURCE_CFG_TEMPLATE)
+        engine.backup_dir = tmp_path / "backups"
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        with zipfile.ZipFile(backup_path, "r") as zf:
+            info = zf.getinfo("Mods/resource.cfg")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read(info).decode("utf-8") == RESOURCE_CFG_TEMPLATE
+
+    def test_backup_inline_threshold_round_trip(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test files on both sides of the inline size limit round-trip."""
+        files = {
+            "small.package": os.urandom(BACKUP_INLINE_MAX_SIZE),
+            "large.package": os.urandom(BACKUP_INLINE_MAX_SIZE + 1),
+            "small.cfg": b"x" * BACKUP_INLINE_MAX_SIZE,
+            "large.cfg": b"y" * (BACKUP_INLINE_MAX_SIZE + 1),
+        }
+        for name, data in files.items():
+            (game_mods / name).write_bytes(data)
+        engine.backup_dir = tmp_path / "backups"
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        with zipfile.ZipFile(backup_path, "r") as zf:
+            assert zf.testzip() is None
+            for name, data in files.items():
+                info = zf.getinfo(f"Mods/{name}")
+                expected = (
+                    zipfile.ZIP_STORED if name.endswith(".package") else zipfile.ZIP_DEFLATED
+                )
+                assert info.compress_type == expected
+                assert zf.read(info) == data
+
+    def test_backup_many_small_files(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test more small files than the read-ahead window are all archived."""
+        expected = {}
+        for i in range(BACKUP_READ_AHEAD * 2 + 5):
+            folder = game_mods / f"Creator{i % 7}"
+            folder.mkdir(exist_ok=True)
+            data = os.urandom(32 + i)
+            (folder / f"mod_{i}.package").write_bytes(data)
+            expected[f"Mods/Creator{i % 7}/mod_{i}.package"] = data
+        engine.backup_dir = tmp_path / "backups"
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        with zipfile.ZipFile(backup_path, "r") as zf:
+            assert {name: zf.read(name) for name in zf.namelist()} == expected
+
+    def test_backup_read_error_raises(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test a failed background read aborts the backup."""
+        (game_mods / "mod.package").write_bytes(b"DBPF")
+        engine.backup_dir = tmp_path / "backups"
+
+        with patch(
+            "src.core.deploy_engine._read_file", side_effect=OSError("Read error")
+        ):
+            with pytest.raises(DeployError, match="Failed to create backup"):
+                engine._backup_current_mods(game_mods)
+
+    def test_backup_stored_compression_skips_deflate(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test ZIP_STORED backups store every entry, configs included."""
+        (game_mods / "resource.cfg").write_text(RESOURCE_CFG_TEMPLATE)
+        engine.backup_dir = tmp_path / "backups"
+        engine.backup_compression = zipfile.ZIP_STORED
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        with zipfile.ZipFile(backup_path, "r") as zf:
+            info = zf.getinfo("Mods/resource.cfg")
+            assert info.compress_type == zipfile.ZIP_STORED
+            assert zf.read(info).decode("utf-8") == RESOURCE_CFG_TEMPLATE
+
     def test_backup_empty_mods_folder(
         self,
         engine: DeployEngine,
@@ -123,13 +345,41 @@ class TestDeployEngine:
 
         assert backup_path.exists()
 
+    def test_backup_with_inaccessible_files(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test an unreadable folder aborts the backup with DeployError."""
+        (game_mods / "accessible.package").write_bytes(b"DBPF")
+        locked = game_mods / "Locked"
+        locked.mkdir()
+        (locked / "hidden.package").write_bytes(b"DBPF")
+        engine.backup_dir = tmp_path / "backups"
+
+        real_scandir = os.scandir
+
+        @contextmanager
+        def fake_scandir(path):
+            if os.path.basename(path) == "Locked":
+                raise PermissionError(f"Access denied: {path}")
+            with real_scandir(path) as it:
+                yield it
+
+        monkeypatch.setattr("src.core.deploy_engine.os.scandir", fake_scandir)
+
+        with pytest.raises(DeployError, match="Failed to create backup"):
+            engine._backup_current_mods(game_mods)
+
     def test_validate_active_mods_valid(
         self,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
     ) -> None:
         """Test validation of valid ActiveMods folder."""
-        engine._validate_active_mods(active_mods)  # Should not raise
+        engine._validate_active_mods(active_mods_template)  # Should not raise
 
     def test_validate_active_mods_empty(
         self,
@@ -143,6 +393,31 @@ class TestDeployEngine:
         with pytest.raises(PathError, match="No mod files found"):
             engine._validate_active_mods(empty_dir)
 
+    def test_validate_active_mods_nested_script(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test validation finds a mod file nested below other folders."""
+        nested = tmp_path / "ActiveMods" / "Scripts" / "Deep"
+        nested.mkdir(parents=True)
+        (nested / "mod.TS4SCRIPT").write_bytes(b"PK")
+
+        engine._validate_active_mods(tmp_path / "ActiveMods")  # Should not raise
+
+    def test_validate_active_mods_ignores_other_files(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test validation rejects folders with no mod file types."""
+        folder = tmp_path / "ActiveMods"
+        (folder / "Docs").mkdir(parents=True)
+        (folder / "Docs" / "readme.txt").write_text("notes")
+
+        with pytest.raises(PathError, match="No mod files found"):
+            engine._validate_active_mods(folder)
+
     def test_validate_active_mods_not_directory(
         self,
         engine: DeployEngine,
@@ -172,6 +447,85 @@ class TestDeployEngine:
         assert "DirectoryFiles" in content
         assert "ActiveMods" in content
 
+    def test_generate_resource_cfg_matches_template(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+    ) -> None:
+        """Test resource.cfg is written byte-for-byte from the template."""
+        cfg_path = engine.generate_resource_cfg(game_mods)
+
+        assert cfg_path.read_bytes() == RESOURCE_CFG_TEMPLATE.encode("utf-8")
+
+    def test_generate_resource_cfg_does_not_read_back(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+    ) -> None:
+        """Test generation does not read the written file back."""
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+            cfg_path = engine.generate_resource_cfg(game_mods)
+
+        assert cfg_path.exists()
+
+    def test_resource_cfg_template_matches_pattern(self) -> None:
+        """Test the shipped template passes the resource.cfg syntax check."""
+        assert RESOURCE_CFG_PATTERN.search(RESOURCE_CFG_BYTES) is not None
+
+    def test_generate_resource_cfg_creates_mods_folder(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test resource.cfg generation creates a missing Mods folder."""
+        cfg_path = engine.generate_resource_cfg(tmp_path / "Mods")
+
+        assert cfg_path == tmp_path / "Mods" / "resource.cfg"
+        assert cfg_path.is_file()
+
+    def test_generate_resource_cfg_permission_error(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+    ) -> None:
+        """Test a failed write surfaces as DeployError."""
+        with patch(
+            "src.core.deploy_engine.os.open", side_effect=PermissionError("Access denied")
+        ):
+            with pytest.raises(DeployError, match="Failed to generate resource.cfg"):
+                engine.generate_resource_cfg(game_mods)
+
+    def test_generate_resource_cfg_replace_failure_keeps_old_file(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+    ) -> None:
+        """Test a failed rename leaves the previous config and no temp file."""
+        cfg_path = game_mods / "resource.cfg"
+        cfg_path.write_text("Priority 500\n")
+
+        with patch(
+            "src.core.deploy_engine.os.replace", side_effect=OSError("Sharing violation")
+        ):
+            with pytest.raises(DeployError, match="Failed to generate resource.cfg"):
+                engine.generate_resource_cfg(game_mods)
+
+        assert cfg_path.read_text() == "Priority 500\n"
+        assert sorted(p.name for p in game_mods.iterdir()) == ["resource.cfg"]
+
+    def test_generate_resource_cfg_overwrites_existing(
+        self,
+        engine: DeployEngine,
+        game_mods: Path,
+    ) -> None:
+        """Test an existing resource.cfg is replaced with the template."""
+        (game_mods / "resource.cfg").write_text("old")
+
+        cfg_path = engine.generate_resource_cfg(game_mods)
+
+        assert cfg_path.read_bytes() == RESOURCE_CFG_TEMPLATE.encode("utf-8")
+        assert sorted(p.name for p in game_mods.iterdir()) == ["resource.cfg"]
+
     def test_validate_resource_cfg_syntax_valid(
         self,
         engine: DeployEngine,
@@ -194,121 +548,475 @@ class TestDeployEngine:
 
         assert engine._validate_resource_cfg_syntax(cfg_path) is False
 
-    @patch("src.core.deploy_engine.GameProcessManager")
-    def test_close_game_safely_not_running(
+    def test_validate_resource_cfg_syntax_requires_priority_value(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test validation rejects a Priority directive without a value."""
+        cfg_path = tmp_path / "resource.cfg"
+        cfg_path.write_text("Priority\nDirectoryFiles Mods/ActiveMods/*.package\n")
+
+        assert engine._validate_resource_cfg_syntax(cfg_path) is False
+
+    def test_validate_resource_cfg_syntax_ignores_inline_directives(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test directives only count at the start of a line."""
+        cfg_path = tmp_path / "resource.cfg"
+        cfg_path.write_text(
+            "# Priority 1000\n# DirectoryFiles Mods/ActiveMods/*.package\n"
+        )
+
+        assert engine._validate_resource_cfg_syntax(cfg_path) is False
+
+    def test_validate_resource_cfg_syntax_crlf(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test validation accepts Windows line endings."""
+        cfg_path = tmp_path / "resource.cfg"
+        cfg_path.write_bytes(RESOURCE_CFG_TEMPLATE.replace("\n", "\r\n").encode("utf-8"))
+
+        assert engine._validate_resource_cfg_syntax(cfg_path) is True
+
+    def test_close_game_safely_not_running(
+        self,
+        game_process_manager_stub: GameProcessManagerStub,
+        engine: DeployEngine,
+    ) -> None:
+        """Test closing when game is not running."""
+        game_process_manager_stub.running = False
+
+        engine._close_game_safely()  # Should not raise
+
+        assert game_process_manager_stub.close_calls == 0
+
+    def test_close_game_safely_success(
+        self,
+        game_process_manager_stub: GameProcessManagerStub,
+        engine: DeployEngine,
+    ) -> None:
+        """Test successful game closure."""
+        game_process_manager_stub.running = True
+        game_process_manager_stub.close_ok = True
+
+        engine._close_game_safely()  # Should not raise
+
+        assert game_process_manager_stub.close_calls == 1
+
+    def test_close_game_safely_failure(
+        self,
+        game_process_manager_stub: GameProcessManagerStub,
+        engine: DeployEngine,
+    ) -> None:
+        """Test failure to close game."""
+        game_process_manager_stub.running = True
+        game_process_manager_stub.close_ok = False
+
+        with pytest.raises(DeployError, match="Failed to close game"):
+            engine._close_game_safely()
+
+    def test_close_game_reuses_manager_within_transaction(
+        self,
+        game_process_manager_stub: GameProcessManagerStub,
+        engine: DeployEngine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test one process manager serves the whole transaction."""
+        factory = Mock(return_value=game_process_manager_stub)
+        monkeypatch.setattr("src.core.deploy_engine.GameProcessManager", factory)
+        game_process_manager_stub.running = True
+
+        with engine.transaction():
+            engine._close_game_safely()
+            engine._close_game_safely()
+            assert engine._process_manager is game_process_manager_stub
+
+        factory.assert_called_once_with()
+        assert game_process_manager_stub.close_calls == 2
+        assert engine._process_manager is None
+        assert game_process_manager_stub.exit_calls == 1
+
+    def test_close_game_outside_transaction_releases_manager(
+        self,
+        game_process_manager_stub: GameProcessManagerStub,
+        engine: DeployEngine,
+    ) -> None:
+        """Test a manager used outside a transaction is exited, not cached."""
+        game_process_manager_stub.running = True
+
+        engine._close_game_safely()
+
+        assert game_process_manager_stub.close_calls == 1
+        assert game_process_manager_stub.exit_calls == 1
+        assert engine._process_manager is None
+
+    def test_reset_exits_live_process_manager(
+        self,
+        game_process_manager_stub: GameProcessManagerStub,
+        engine: DeployEngine,
+    ) -> None:
+        """Test reset exits a held process manager before dropping it."""
+        engine._in_transaction = True
+        engine._get_process_manager()
+
+        engine.reset()
+
+        assert game_process_manager_stub.exit_calls == 1
+        assert engine._process_manager is None
+
+    def test_copy_files(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test file copy deployment method."""
+        target = tmp_path / "target"
+
+        success = engine._copy_files(active_mods_template, target)
+
+        assert success is True
+        assert target.exists()
+        assert (target / "test_mod.package").exists()
+        assert (target / "subfolder" / "another_mod.package").exists()
+
+    def test_copy_files_mirrors_empty_dirs(
+        self,
+        engine: DeployEngine,
+        active_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test directory structure is mirrored, including empty folders."""
+        (active_mods / "empty").mkdir()
+        target = tmp_path / "target"
+
+        assert engine._copy_files(active_mods, target) is True
+
+        assert (target / "empty").is_dir()
+
+    def test_copy_files_existing_target_fails(
+        self,
+        engine: DeployEngine,
+        active_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test copy refuses to overwrite an existing target."""
+        target = tmp_path / "target"
+        target.mkdir()
+
+        assert engine._copy_files(active_mods, target) is False
+
+    def test_copy_files_many_files(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test concurrent copy of a wide, nested tree."""
+        source = tmp_path / "source"
+        for folder in range(5):
+            (source / f"folder_{folder}").mkdir(parents=True)
+            for i in range(20):
+                (source / f"folder_{folder}" / f"mod_{i}.package").write_bytes(
+                    b"DBPF" + bytes([folder, i]) * 16
+                )
+        target = tmp_path / "target"
+
+        assert engine._copy_files(source, target) is True
+
+        copied = sorted(p.relative_to(target) for p in target.rglob("*.package"))
+        assert copied == sorted(p.relative_to(source) for p in source.rglob("*.package"))
+        assert engine.verify_deployment(source, target) is True
+
+    def test_copy_files_reports_per_file_progress(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test each completed copy is reported with running and total counts."""
+        file_progress = Mock()
+        total = sum(1 for p in active_mods_template.rglob("*") if p.is_file())
+
+        assert engine._copy_files(active_mods_template, tmp_path / "target", file_progress)
+
+        assert file_progress.call_args_list == [
+            call(done, total) for done in range(1, total + 1)
+        ]
+
+    def test_deploy_throttles_per_file_progress(
         self,
-        mock_manager_class: Mock,
+        game_process_manager_stub: GameProcessManagerStub,
         engine: DeployEngine,
+        game_mods: Path,
+        tmp_path: Path,
     ) -> None:
-        """Test closing when game is not running."""
-        mock_manager = MagicMock()
-        mock_manager.is_game_running.return_value = False
-        mock_manager_class.return_value.__enter__.return_value = mock_manager
+        """Test per-file copy updates within one step are coalesced."""
+        source = tmp_path / "many"
+        source.mkdir()
+        for i in range(50):
+            (source / f"mod_{i}.package").write_bytes(b"DBPF")
+        engine.backup_dir = tmp_path / "backups"
+        progress_calls = []
 
-        engine._close_game_safely()  # Should not raise
+        # Interval longer than the test, so only the step change gets through
+        with patch("src.core.deploy_engine.PROGRESS_MIN_INTERVAL", 3600.0), patch.object(
+            engine, "_create_symlink", return_value=False
+        ), patch.object(engine, "_create_hardlinks", return_value=False), engine.transaction():
+            engine.deploy(
+                source,
+                game_mods,
+                lambda step, pct: progress_calls.append((step, pct)),
+                close_game=False,
+            )
 
-        mock_manager.close_game_safely.assert_not_called()
+        copy_updates = [pct for step, pct in progress_calls if step == "Deploying mods"]
+        assert copy_updates == [60.0]
+        assert progress_calls[-1] == ("Complete", 100.0)
 
-    @patch("src.core.deploy_engine.GameProcessManager")
-    def test_close_game_safely_success(
+    def test_copy_files_worker_error_fails(
         self,
-        mock_manager_class: Mock,
         engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
     ) -> None:
-        """Test successful game closure."""
-        mock_manager = MagicMock()
-        mock_manager.is_game_running.return_value = True
-        mock_manager.close_game_safely.return_value = True
-        mock_manager_class.return_value.__enter__.return_value = mock_manager
+        """Test an error in any copy worker fails the copy method."""
+        with patch(
+            "src.core.deploy_engine._copy_file", side_effect=OSError("disk full")
+        ):
+            assert engine._copy_files(active_mods_template, tmp_path / "target") is False
 
-        engine._close_game_safely()  # Should not raise
+    def test_copy_files_preserves_content(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test copied files are byte-identical to sources."""
+        target = tmp_path / "target"
 
-        mock_manager.close_game_safely.assert_called_once()
+        assert engine._copy_files(active_mods_template, target) is True
 
-    @patch("src.core.deploy_engine.GameProcessManager")
-    def test_close_game_safely_failure(
+        assert (target / "test_mod.package").read_bytes() == (
+            active_mods_template / "test_mod.package"
+        ).read_bytes()
+
+    def test_copy_files_falls_back_to_buffered_copy(
         self,
-        mock_manager_class: Mock,
         engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
     ) -> None:
-        """Test failure to close game."""
-        mock_manager = MagicMock()
-        mock_manager.is_game_running.return_value = True
-        mock_manager.close_game_safely.return_value = False
-        mock_manager_class.return_value.__enter__.return_value = mock_manager
-
-        with pytest.raises(DeployError, match="Failed to close game"):
-            engine._close_game_safely()
+        """Test read/write fallback when every in-kernel copy is refused."""
+        target = tmp_path / "target"
 
-    def test_copy_files(
+        with patch(
+            "src.core.deploy_engine.os.copy_file_range",
+            side_effect=OSError("EXDEV"),
+            create=True,
+        ), patch(
+            "src.core.deploy_engine.os.sendfile",
+            side_effect=OSError("EINVAL"),
+            create=True,
+        ):
+            assert engine._copy_files(active_mods_template, target) is True
+
+        assert (target / "test_mod.package").read_bytes() == (
+            active_mods_template / "test_mod.package"
+        ).read_bytes()
+
+    def test_copy_files_falls_back_without_copy_file_range(
         self,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         tmp_path: Path,
     ) -> None:
-        """Test file copy deployment method."""
+        """Test buffered fallback when in-kernel copy is refused."""
         target = tmp_path / "target"
 
-        success = engine._copy_files(active_mods, target)
+        with patch(
+            "src.core.deploy_engine.os.copy_file_range",
+            side_effect=OSError("EXDEV"),
+            create=True,
+        ):
+            assert engine._copy_files(active_mods_template, target) is True
 
-        assert success is True
-        assert target.exists()
-        assert (target / "test_mod.package").exists()
-        assert (target / "subfolder" / "another_mod.package").exists()
+        assert (target / "subfolder" / "another_mod.package").read_bytes() == (
+            active_mods_template / "subfolder" / "another_mod.package"
+        ).read_bytes()
 
-    @patch("subprocess.run")
     def test_create_junction_success(
         self,
-        mock_run: Mock,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test junction creation on Windows."""
         if os.name != "nt":
             pytest.skip("Junction test requires Windows")
 
         target = tmp_path / "junction"
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run = Mock(return_value=Mock(returncode=0))
+        monkeypatch.setattr("src.core.deploy_engine.subprocess.run", mock_run)
+        monkeypatch.setattr("ctypes.windll.shell32.IsUserAnAdmin", lambda: 1)
 
-        with patch("ctypes.windll.shell32.IsUserAnAdmin", return_value=1):
-            success = engine._create_junction(active_mods, target)
+        success = engine._create_junction(active_mods_template, target)
 
         assert success is True
         mock_run.assert_called_once()
 
-    @patch("os.symlink")
     def test_create_symlink_success(
         self,
-        mock_symlink: Mock,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test symlink creation."""
         target = tmp_path / "symlink"
+        mock_symlink = Mock()
+        monkeypatch.setattr("src.core.deploy_engine.os.symlink", mock_symlink)
 
-        success = engine._create_symlink(active_mods, target)
+        success = engine._create_symlink(active_mods_template, target)
 
         assert success is True
         mock_symlink.assert_called_once_with(
-            active_mods, target, target_is_directory=True
+            active_mods_template, target, target_is_directory=True
         )
 
-    @patch("os.symlink", side_effect=OSError("Permission denied"))
     def test_create_symlink_failure(
         self,
-        mock_symlink: Mock,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test symlink creation failure."""
         target = tmp_path / "symlink"
+        monkeypatch.setattr(
+            "src.core.deploy_engine.os.symlink",
+            Mock(side_effect=OSError("Permission denied")),
+        )
+
+        success = engine._create_symlink(active_mods_template, target)
+
+        assert success is False
+
+    def test_deploy_with_fallback_skips_junction_off_windows(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test the junction method is not attempted outside Windows."""
+        target = tmp_path / "deployed"
+
+        with patch("src.core.deploy_engine._IS_WINDOWS", False), patch.object(
+            engine, "_create_junction"
+        ) as mock_junction, patch.object(
+            engine, "_create_symlink", return_value=True
+        ):
+            assert engine._deploy_with_fallback(active_mods_template, target) is True
+
+        mock_junction.assert_not_called()
+        assert engine._deployment_method == "symlink"
+
+    def test_create_hardlinks_success(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test hardlink deployment mirrors the tree without copying data."""
+        target = tmp_path / "hardlinks"
+
+        success = engine._create_hardlinks(active_mods_template, target)
+
+        assert success is True
+        for source_file in active_mods_template.rglob("*.package"):
+            linked = target / source_file.relative_to(active_mods_template)
+            assert os.path.samefile(source_file, linked)
+
+    def test_create_hardlinks_cross_device_cleans_up(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test a cross-volume failure removes the partial tree."""
+        target = tmp_path / "hardlinks"
 
-        success = engine._create_symlink(active_mods, target)
+        with patch(
+            "src.core.deploy_engine.os.link",
+            side_effect=OSError(18, "Invalid cross-device link"),
+        ):
+            success = engine._create_hardlinks(active_mods_template, target)
+
+        assert success is False
+        assert not target.exists()
+
+    def test_create_hardlinks_skips_other_volume(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test differing devices skip hardlinking without linking anything."""
+        target = tmp_path / "hardlinks"
+        real_stat = os.stat
+
+        def fake_stat(path, *args, **kwargs):
+            result = real_stat(path, *args, **kwargs)
+            if os.fspath(path) == os.fspath(target):
+                values = list(result)
+                values[2] = result.st_dev + 1  # st_dev
+                return os.stat_result(values)
+            return result
+
+        with patch("src.core.deploy_engine.os.stat", side_effect=fake_stat), patch(
+            "src.core.deploy_engine.os.link"
+        ) as mock_link:
+            success = engine._create_hardlinks(active_mods_template, target)
 
         assert success is False
+        mock_link.assert_not_called()
+        assert not target.exists()
+
+    def test_create_hardlinks_existing_target_fails(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test hardlink deployment refuses to merge into an existing folder."""
+        target = tmp_path / "hardlinks"
+        target.mkdir()
+        (target / "keep.txt").write_text("keep")
+
+        assert engine._create_hardlinks(active_mods_template, target) is False
+        assert (target / "keep.txt").exists()
+
+    def test_deploy_with_fallback_uses_hardlinks(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test hardlinks are tried before copying when links are unavailable."""
+        target = tmp_path / "deployed"
+
+        with patch.object(engine, "_create_junction", return_value=False), patch.object(
+            engine, "_create_symlink", return_value=False
+        ), patch.object(engine, "_copy_files") as mock_copy:
+            assert engine._deploy_with_fallback(active_mods_template, target) is True
+
+        assert engine._deployment_method == "hardlink"
+        mock_copy.assert_not_called()
 
     def test_hash_file(self, engine: DeployEngine, tmp_path: Path) -> None:
         """Test file hashing."""
@@ -325,25 +1033,57 @@ class TestDeployEngine:
         hash_value2 = engine._hash_file(test_file)
         assert hash_value == hash_value2
 
+    def test_hash_file_streams_large_file(
+        self, engine: DeployEngine, tmp_path: Path
+    ) -> None:
+        """Test chunked hashing matches a whole-file CRC32."""
+        import zlib
+
+        test_file = tmp_path / "large.package"
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        test_file.write_bytes(data)
+
+        assert engine._hash_file(test_file) == zlib.crc32(data)
+
+    def test_hash_file_at_mmap_threshold(
+        self, engine: DeployEngine, tmp_path: Path
+    ) -> None:
+        """Test read and mmap hashing agree on either side of the threshold."""
+        import zlib
+
+        for size in (HASH_MMAP_THRESHOLD, HASH_MMAP_THRESHOLD + 1):
+            test_file = tmp_path / f"mod_{size}.package"
+            data = os.urandom(size)
+            test_file.write_bytes(data)
+
+            assert engine._hash_file(test_file) == zlib.crc32(data)
+
+    def test_hash_file_empty(self, engine: DeployEngine, tmp_path: Path) -> None:
+        """Test hashing an empty file."""
+        empty = tmp_path / "empty.package"
+        empty.write_bytes(b"")
+
+        assert engine._hash_file(empty) == 0
+
     def test_verify_deployment_success(
         self,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         tmp_path: Path,
     ) -> None:
         """Test successful deployment verification."""
         # Copy files to create identical target
         target = tmp_path / "deployed"
-        engine._copy_files(active_mods, target)
+        engine._copy_files(active_mods_template, target)
 
-        result = engine.verify_deployment(active_mods, target)
+        result = engine.verify_deployment(active_mods_template, target)
 
         assert result is True
 
     def test_verify_deployment_missing_file(
         self,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         tmp_path: Path,
     ) -> None:
         """Test verification fails with missing file."""
@@ -353,27 +1093,140 @@ class TestDeployEngine:
         # Copy only one file
         (target / "test_mod.package").write_bytes(b"DBPF" + b"\x00" * 100)
 
-        result = engine.verify_deployment(active_mods, target)
+        with patch.object(engine, "_hash_file") as hasher:
+            result = engine.verify_deployment(active_mods_template, target)
 
         assert result is False
+        hasher.assert_not_called()  # Missing files fail before any hashing
 
     def test_verify_deployment_hash_mismatch(
         self,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         tmp_path: Path,
     ) -> None:
         """Test verification fails with hash mismatch."""
         target = tmp_path / "deployed"
-        engine._copy_files(active_mods, target)
+        engine._copy_files(active_mods_template, target)
 
         # Corrupt one file
         (target / "test_mod.package").write_bytes(b"corrupted")
 
-        result = engine.verify_deployment(active_mods, target)
+        result = engine.verify_deployment(active_mods_template, target)
 
         assert result is False
 
+    def test_verify_deployment_same_size_content_mismatch(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test same-size corruption is caught even with a matching mtime."""
+        target = tmp_path / "deployed"
+        engine._copy_files(active_mods_template, target)
+
+        corrupted = target / "test_mod.package"
+        corrupted.write_bytes(b"XXXX" + b"\x00" * 100)
+        shutil.copystat(active_mods_template / "test_mod.package", corrupted)
+
+        with patch.object(engine, "_hash_file", wraps=engine._hash_file) as hasher:
+            assert engine.verify_deployment(active_mods_template, target) is False
+
+        assert hasher.called
+
+    def test_verify_deployment_exception(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test a read error inside a verification worker fails verification."""
+        target = tmp_path / "deployed"
+        engine._copy_files(active_mods_template, target)
+
+        with patch.object(engine, "_hash_file", side_effect=OSError("Read error")):
+            assert engine.verify_deployment(active_mods_template, target) is False
+
+    def test_verify_deployment_hardlinks_skip_hashing(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test hardlinked deployments verify by inode without hashing."""
+        target = tmp_path / "deployed"
+        assert engine._create_hardlinks(active_mods_template, target) is True
+
+        with patch.object(engine, "_hash_file") as hasher:
+            assert engine.verify_deployment(active_mods_template, target) is True
+
+        hasher.assert_not_called()
+
+    def test_verify_file_ignores_zero_inodes(self, engine: DeployEngine) -> None:
+        """Test zero inodes never count as the same file."""
+        source = Mock(path="a.package")
+        target = Mock(path="b.package")
+        source.inode.return_value = 0
+        target.inode.return_value = 0
+        source.stat.return_value = Mock(st_ino=0, st_dev=0, st_size=4, st_mtime_ns=1)
+        target.stat.return_value = Mock(st_ino=0, st_dev=0, st_size=5, st_mtime_ns=2)
+
+        assert engine._verify_file(source, target) is False
+
+    def test_verify_file_hardlink_uses_entry_inode(self, engine: DeployEngine) -> None:
+        """Test hardlinks skip hashing when scandir stat has no inode (Windows)."""
+        source = Mock(path="a.package")
+        target = Mock(path="b.package")
+        source.inode.return_value = 42
+        target.inode.return_value = 42
+        source.stat.return_value = Mock(st_ino=0, st_dev=0, st_size=4)
+        target.stat.return_value = Mock(st_ino=0, st_dev=0, st_size=4)
+        full_stat = os.stat_result((0o100644, 42, 7, 2, 0, 0, 4, 0, 0, 0))
+
+        with patch("src.core.deploy_engine.os.stat", return_value=full_stat):
+            with patch.object(engine, "_hash_file") as hasher:
+                assert engine._verify_file(source, target) is True
+
+        hasher.assert_not_called()
+
+    def test_verify_deployment_hashes_copies(
+        self,
+        engine: DeployEngine,
+        active_mods_template: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test copied files are hashed even though copystat matched mtimes."""
+        target = tmp_path / "deployed"
+        engine._copy_files(active_mods_template, target)
+
+        with patch.object(engine, "_hash_file", wraps=engine._hash_file) as hasher:
+            assert engine.verify_deployment(active_mods_template, target) is True
+
+        assert hasher.called
+
+    def test_verify_deployment_many_files(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test concurrent verification across many files."""
+        source = tmp_path / "source"
+        source.mkdir()
+        for i in range(50):
+            (source / f"mod_{i:02d}.package").write_bytes(b"DBPF" + bytes([i]) * 64)
+
+        target = tmp_path / "deployed"
+        engine._copy_files(source, target)
+
+        assert engine.verify_deployment(source, target) is True
+
+        # Same size and (pinned) same mtime: only the content differs
+        (target / "mod_42.package").write_bytes(b"DBPF" + b"\xff" * 64)
+        shutil.copystat(source / "mod_42.package", target / "mod_42.package")
+
+        assert engine.verify_deployment(source, target) is False
+
     def test_remove_deployment_directory(
         self,
         engine: DeployEngine,
@@ -388,6 +1241,68 @@ class TestDeployEngine:
 
         assert not deployed.exists()
 
+    def test_remove_deployment_dangling_link(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test a link whose target is gone is still removed."""
+        deployed = tmp_path / "ActiveMods"
+        try:
+            os.symlink(tmp_path / "gone", deployed, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlinks not permitted")
+
+        engine._remove_deployment(deployed)
+
+        assert not os.path.lexists(deployed)
+
+    def test_remove_deployment_missing_path(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test removing a deployment that does not exist is a no-op."""
+        engine._remove_deployment(tmp_path / "ActiveMods")  # Should not raise
+
+    def test_remove_deployment_nested_tree(
+        self,
+        engine: DeployEngine,
+        active_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test removing a deep copied deployment with many files."""
+        deployed = tmp_path / "deployed"
+        engine._copy_files(active_mods, deployed)
+        for i in range(40):
+            folder = deployed / f"Creator{i % 5}" / f"Set{i % 3}"
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / f"mod_{i}.package").write_bytes(b"DBPF")
+
+        engine._remove_deployment(deployed)
+
+        assert not deployed.exists()
+        assert (active_mods / "test_mod.package").exists()
+
+    def test_remove_deployment_does_not_follow_links(
+        self,
+        engine: DeployEngine,
+        active_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test links inside a deployment are removed, not their targets."""
+        deployed = tmp_path / "deployed"
+        deployed.mkdir()
+        try:
+            os.symlink(active_mods, deployed / "linked", target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlinks not permitted")
+
+        engine._remove_deployment(deployed)
+
+        assert not deployed.exists()
+        assert (active_mods / "subfolder" / "another_mod.package").exists()
+
     def test_validate_game_accessibility(
         self,
         engine: DeployEngine,
@@ -435,6 +1350,91 @@ class TestDeployEngine:
         restored = tmp_path / "Mods" / "original.txt"
         assert restored.exists()
 
+    def test_rollback_restores_many_nested_files(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test concurrent extraction restores every file intact."""
+        backup_path = tmp_path / "backup.zip"
+        expected = {
+            f"Mods/Creator{i % 4}/Set{i % 3}/mod_{i}.package": os.urandom(64)
+            for i in range(60)
+        }
+        with zipfile.ZipFile(backup_path, "w") as zf:
+            zf.writestr("Mods/Empty/", "")
+            for name, data in expected.items():
+                zf.writestr(name, data)
+
+        deployed = tmp_path / "Mods" / "ActiveMods"
+        deployed.mkdir(parents=True)
+
+        engine.rollback(backup_path, deployed)
+
+        assert (tmp_path / "Mods" / "Empty").is_dir()
+        for name, data in expected.items():
+            assert (tmp_path / name).read_bytes() == data
+
+    def test_rollback_contains_traversal_entries(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test archive names with .. cannot escape the extraction root."""
+        root = tmp_path / "root"
+        backup_path = tmp_path / "backup.zip"
+        with zipfile.ZipFile(backup_path, "w") as zf:
+            zf.writestr("../../evil.txt", "evil")
+
+        deployed = root / "Mods" / "ActiveMods"
+        deployed.mkdir(parents=True)
+
+        engine.rollback(backup_path, deployed)
+
+        assert (root / "evil.txt").read_text() == "evil"
+        assert not (tmp_path / "evil.txt").exists()
+
+    def test_rollback_corrupt_archive_raises(
+        self,
+        engine: DeployEngine,
+        tmp_path: Path,
+    ) -> None:
+        """Test an unreadable backup surfaces as DeployError."""
+        backup_path = tmp_path / "backup.zip"
+        backup_path.write_bytes(b"not a zip")
+        deployed = tmp_path / "Mods" / "ActiveMods"
+
+        with pytest.raises(DeployError, match="Rollback failed"):
+            engine.rollback(backup_path, deployed)
+
+    def test_tar_backup_and_rollback(
+        self,
+        game_mods: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test tar backups round-trip through rollback."""
+        import tarfile
+
+        engine = DeployEngine(backup_dir=tmp_path / "backups", backup_format="tar")
+        (game_mods / "existing_mod.package").write_bytes(b"DBPF" + b"\x01" * 32)
+
+        backup_path = engine._backup_current_mods(game_mods)
+
+        assert backup_path.suffix == ".tar"
+        with tarfile.open(backup_path) as tf:
+            assert "Mods/existing_mod.package" in tf.getnames()
+
+        (game_mods / "existing_mod.package").unlink()
+        deployed = game_mods / "ActiveMods"
+        deployed.mkdir()
+
+        engine.rollback(backup_path, deployed)
+
+        assert not deployed.exists()
+        assert (game_mods / "existing_mod.package").read_bytes() == (
+            b"DBPF" + b"\x01" * 32
+        )
+
     def test_report_progress_with_callback(self, engine: DeployEngine) -> None:
         """Test progress reporting with callback."""
         callback = Mock()
@@ -443,6 +1443,48 @@ class TestDeployEngine:
 
         callback.assert_called_once_with("Test step", 50.0)
 
+    def test_report_progress_throttles_rapid_updates(
+        self, engine: DeployEngine
+    ) -> None:
+        """Test rapid same-step updates are coalesced but completion fires."""
+        callback = Mock()
+
+        engine._report_progress(callback, "Copying", 10.0)
+        engine._report_progress(callback, "Copying", 11.0)
+        engine._report_progress(callback, "Copying", 12.0)
+        engine._report_progress(callback, "Complete", 100.0)
+
+        assert callback.call_args_list == [
+            call("Copying", 10.0),
+            call("Complete", 100.0),
+        ]
+
+    def test_report_progress_delivers_step_changes(
+        self, engine: DeployEngine
+    ) -> None:
+        """Test a new step is reported even inside the throttle interval."""
+        callback = Mock()
+
+        engine._report_progress(callback, "Step 1", 10.0)
+        engine._report_progress(callback, "Step 2", 20.0)
+
+        assert callback.call_args_list == [
+            call("Step 1", 10.0),
+            call("Step 2", 20.0),
+        ]
+
+    def test_report_progress_delivers_restart(self, engine: DeployEngine) -> None:
+        """Test a step restarting at 0% is reported inside the interval."""
+        callback = Mock()
+
+        engine._report_progress(callback, "Copying", 40.0)
+        engine._report_progress(callback, "Copying", 0.0)
+
+        assert callback.call_args_list == [
+            call("Copying", 40.0),
+            call("Copying", 0.0),
+        ]
+
     def test_report_progress_without_callback(self, engine: DeployEngine) -> None:
         """Test progress reporting without callback."""
         engine._report_progress(None, "Test step", 50.0)  # Should not raise
@@ -450,17 +1492,16 @@ class TestDeployEngine:
     def test_deploy_without_transaction(
         self,
         engine: DeployEngine,
-        active_mods: Path,
+        active_mods_template: Path,
         game_mods: Path,
     ) -> None:
         """Test deploy fails outside transaction context."""
         with pytest.raises(DeployError, match="within transaction context"):
-            engine.deploy(active_mods, game_mods, close_game=False)
+            engine.deploy(active_mods_template, game_mods, close_game=False)
 
-    @patch("src.core.deploy_engine.GameProcessManager")
     def test_deploy_full_flow(
         self,
-        mock_manager_class: Mock,
+        game_process_manager_stub: GameProcessManagerStub,
         engine: DeployEngine,
         active_mods: Path,
         game_mods: Path,
@@ -469,9 +1510,7 @@ class TestDeployEngine:
         """Test full deployment flow."""
         # Setup
         engine.backup_dir = tmp_path / "backups"
-        mock_manager = MagicMock()
-        mock_manager.is_game_running.return_value = False
-        mock_manager_class.return_value.__enter__.return_value = mock_manager
+        game_process_manager_stub.running = False
 
         progress_calls = []
 
@@ -487,7 +1526,10 @@ class TestDeployEngine:
         assert success is True
         assert (game_mods / "resource.cfg").exists()
         assert (game_mods / "ActiveMods").exists()
-        assert len(progress_calls) > 0
+        # Every step change is delivered despite throttling
+        assert progress_calls[0] == ("Validating paths", 0.0)
+        assert ("Deploying mods", 60.0) in progress_calls
+        assert progress_calls[-1] == ("Complete", 100.0)
 
     def test_transaction_rollback_on_exception(
         self,
@@ -512,3 +1554,57 @@ class TestDeployEngine:
 
         # Rollback should have been attempted
         # (may fail in test environment, but should be logged)
+
+
+class TestIterFiles:
+    """Test scandir-based file walker."""
+
+    def test_yields_nested_files_only(self, active_mods_template: Path) -> None:
+        """Test walker yields every file, recursing into subfolders."""
+        found = {
+            os.path.relpath(entry.path, active_mods_template)
+            for entry in _iter_files(str(active_mods_template))
+        }
+
+        assert found == {
+            "test_mod.package",
+            os.path.join("subfolder", "another_mod.package"),
+        }
+
+    def test_empty_directory(self, tmp_path: Path) -> None:
+        """Test walker yields nothing for an empty directory."""
+        assert list(_iter_files(str(tmp_path))) == []
+
+
+class TestIsJunction:
+    """Test junction detection helper."""
+
+    def test_non_windows_is_never_junction(self, tmp_path: Path) -> None:
+        """Test junction detection short-circuits off Windows."""
+        with patch("src.core.deploy_engine._IS_WINDOWS", False):
+            assert _is_junction(tmp_path) is False
+
+    def test_mount_point_reparse_tag(self, tmp_path: Path) -> None:
+        """Test a mount-point reparse tag from a single lstat is a junction."""
+        fake_stat = Mock(st_reparse_tag=0xA0000003)
+
+        with patch("src.core.deploy_engine._IS_WINDOWS", True), patch(
+            "src.core.deploy_engine.os.lstat", return_value=fake_stat
+        ) as mock_lstat:
+            assert _is_junction(tmp_path / "ActiveMods") is True
+
+        mock_lstat.assert_called_once_with(tmp_path / "ActiveMods")
+
+    def test_symlink_reparse_tag_is_not_junction(self, tmp_path: Path) -> None:
+        """Test other reparse points (symlinks) are not junctions."""
+        fake_stat = Mock(st_reparse_tag=0xA000000C)
+
+        with patch("src.core.deploy_engine._IS_WINDOWS", True), patch(
+            "src.core.deploy_engine.os.lstat", return_value=fake_stat
+        ):
+            assert _is_junction(tmp_path / "ActiveMods") is False
+
+    def test_missing_path(self, tmp_path: Path) -> None:
+        """Test a missing path is not a junction."""
+        with patch("src.core.deploy_engine._IS_WINDOWS", True):
+            assert _is_junction(tmp_path / "missing") is False
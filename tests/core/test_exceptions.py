@@ -0,0 +1,303 @@
+"""Tests for the exception hierarchy."""
+
+import re
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pytest
+
+from src.core.exceptions import (
+    BackupError,
+    ConflictError,
+    DeployError,
+    EncryptionError,
+    GameProcessError,
+    HashValidationError,
+    LoadOrderError,
+    ModManagerException,
+    ModScanError,
+    PathError,
+    SecurityError,
+)
+
+# Shared path fixtures; exceptions only read these, so one instance suffices
+P_TEST = Path("test")
+P_TEST_PACKAGE = Path("test.package")
+P_TEST_MOD_PACKAGE = Path("test_mod.package")
+
+# Every concrete subclass of the base exception
+ALL_EXCEPTION_CLASSES = (
+    ModScanError,
+    DeployError,
+    BackupError,
+    SecurityError,
+    GameProcessError,
+    PathError,
+    LoadOrderError,
+    ConflictError,
+    EncryptionError,
+    HashValidationError,
+)
+
+# Conflicting mod names for the multi-conflict case
+TEN_MODS = tuple(f"Mod{i}" for i in range(10))
+
+
+@pytest.fixture(
+    params=[
+        ("ModScanError", lambda: ModScanError(P_TEST, "test")),
+        ("DeployError", lambda: DeployError("test")),
+        ("BackupError", lambda: BackupError(reason="test")),
+        ("SecurityError", lambda: SecurityError(threat_type="test")),
+        ("GameProcessError", lambda: GameProcessError(reason="test")),
+        ("PathError", lambda: PathError(path=P_TEST, reason="test")),
+        ("LoadOrderError", lambda: LoadOrderError("test")),
+        ("ConflictError", lambda: ConflictError("0x1", ["ModA", "ModB"])),
+        ("EncryptionError", lambda: EncryptionError("encrypt")),
+        ("HashValidationError", lambda: HashValidationError(P_TEST, 0x1, 0x2)),
+    ],
+    ids=lambda param: param[0],
+)
+def mm_exception(request: pytest.FixtureRequest) -> ModManagerException:
+    """Build one exception subclass instance per parameter.
+
+    Args:
+        request: Pytest request carrying the (name, factory) parameter
+
+    Returns:
+        Freshly constructed exception
+    """
+    return request.param[1]()
+
+
+class TestModManagerException:
+    """Test base exception construction and formatting."""
+
+    @pytest.mark.parametrize(
+        "kwargs,expected_substrings,attr_checks",
+        [
+            (
+                {"message": "Test error"},
+                ["[UNKNOWN] Test error"],
+                {"error_code": "UNKNOWN", "recovery_hint": None, "context": {}},
+            ),
+            (
+                {"message": "Test error", "error_code": "TEST001"},
+                ["[TEST001]", "Test error"],
+                {"error_code": "TEST001"},
+            ),
+            (
+                {"message": "Test error", "recovery_hint": "Try restarting"},
+                ["Test error", "Suggestion: Try restarting"],
+                {"recovery_hint": "Try restarting"},
+            ),
+            (
+                {"message": "Test error", "extra_info": "some value", "another_key": 123},
+                ["[UNKNOWN] Test error"],
+                {"context": {"extra_info": "some value", "another_key": 123}},
+            ),
+        ],
+        ids=["basic", "error_code", "recovery_hint", "context"],
+    )
+    def test_exception_fields(
+        self,
+        kwargs: dict[str, Any],
+        expected_substrings: list[str],
+        attr_checks: dict[str, Any],
+    ) -> None:
+        """Test message formatting and stored attributes."""
+        exc = ModManagerException(**kwargs)
+        s = str(exc)
+
+        assert exc.message == kwargs["message"]
+        for substring in expected_substrings:
+            assert substring in s
+        for name, value in attr_checks.items():
+            assert getattr(exc, name) == value
+
+    def test_no_suggestion_without_hint(self) -> None:
+        """Test suggestion line is omitted when no hint is given."""
+        assert "Suggestion" not in str(ModManagerException("Test error"))
+
+    def test_exception_is_catchable(self) -> None:
+        """Test the base exception raises with its formatted message."""
+        with pytest.raises(ModManagerException, match=r"^\[UNKNOWN\] Test$"):
+            raise ModManagerException("Test")
+
+
+class TestExceptionInheritance:
+    """Test every exception derives from the base class."""
+
+    @pytest.mark.parametrize(
+        "exc_class", ALL_EXCEPTION_CLASSES, ids=lambda cls: cls.__name__
+    )
+    def test_all_exceptions_inherit_from_base(
+        self, exc_class: type[ModManagerException]
+    ) -> None:
+        """Test every custom exception is a ModManagerException subclass."""
+        assert issubclass(exc_class, ModManagerException)
+        assert issubclass(exc_class, Exception)
+
+    def test_can_catch_all_with_base(self, mm_exception: ModManagerException) -> None:
+        """Test a single base-class handler catches every subclass."""
+        with pytest.raises(ModManagerException) as exc_info:
+            raise mm_exception
+
+        assert exc_info.value is mm_exception
+        assert str(mm_exception).startswith(f"[{mm_exception.error_code}] ")
+
+
+class TestDeployError:
+    """Test deployment error formatting."""
+
+    def test_deploy_error_with_affected_mods(self) -> None:
+        """Test affected mod count is pluralized."""
+        exc = DeployError("copy", affected_mods=[P_TEST_PACKAGE, P_TEST_MOD_PACKAGE])
+        s = str(exc)
+
+        assert exc.operation == "copy"
+        assert "'copy'" in s
+        assert "2 mods" in s
+
+    def test_deploy_error_singular_mod(self) -> None:
+        """Test a single affected mod is not pluralized."""
+        s = str(DeployError("link", affected_mods=[P_TEST_MOD_PACKAGE]))
+
+        assert "1 mod" in s and "mods" not in s
+
+
+class TestBackupError:
+    """Test backup error formatting."""
+
+    def test_backup_error_with_path(self) -> None:
+        """Test operation, path and reason are reported."""
+        exc = BackupError(backup_path=P_TEST, operation_type="restore", reason="Disk full")
+        s = str(exc)
+
+        assert exc.operation_type == "restore"
+        assert f"Backup restore failed for '{P_TEST}': Disk full" in s
+        assert "[BACKUP001]" in s
+
+
+class TestGameProcessError:
+    """Test game process error formatting."""
+
+    def test_game_process_error_message(self) -> None:
+        """Test process name and action are reported."""
+        s = str(GameProcessError(process_name="TS4_x64.exe", action="terminate"))
+
+        assert "'TS4_x64.exe' terminate failed" in s
+
+
+class TestConflictError:
+    """Test conflict error formatting."""
+
+    def test_conflict_error_message(self) -> None:
+        """Test resource ID and conflicting mods are reported."""
+        s = str(ConflictError("0x12345678", ["ModA", "ModB"]))
+
+        assert "Resource conflict detected in resource 0x12345678" in s
+        assert "ModA, ModB" in s
+
+    def test_conflict_error_multiple_conflicts(self) -> None:
+        """Test every conflicting mod is listed."""
+        s = str(ConflictError("0x99999999", list(TEN_MODS)))
+
+        assert ", ".join(TEN_MODS) in s
+
+
+class TestSecurityError:
+    """Test security error formatting."""
+
+    @pytest.mark.parametrize("severity", ["LOW", "MEDIUM", "HIGH", "CRITICAL"])
+    def test_security_error_severity(self, severity: str) -> None:
+        """Test severity is stored and shown in the message."""
+        exc = SecurityError(threat_type="PATH_TRAVERSAL", affected_path=P_TEST, severity=severity)
+
+        assert exc.severity == severity
+        assert f"[{severity}]" in str(exc)
+
+    def test_security_error_path_traversal(self) -> None:
+        """Test threat type, severity, details and path are reported."""
+        exc = SecurityError(
+            threat_type="PATH_TRAVERSAL",
+            affected_path=P_TEST,
+            severity="CRITICAL",
+            details="Escapes Mods folder",
+        )
+        s = str(exc)
+
+        assert "[CRITICAL] Security threat detected: PATH_TRAVERSAL" in s
+        assert "- Escapes Mods folder" in s
+        assert f"Affected file: {P_TEST}" in s
+
+
+class TestEncryptionError:
+    """Test encryption error formatting."""
+
+    @pytest.mark.parametrize(
+        "operation,reason",
+        [("encrypt", None), ("decrypt", "Corrupted data")],
+        ids=["encrypt", "decrypt"],
+    )
+    def test_encryption_error(self, operation: str, reason: Optional[str]) -> None:
+        """Test operation and optional reason are reported."""
+        exc = EncryptionError(operation, reason=reason)
+        s = str(exc)
+
+        assert exc.operation == operation
+        assert f"Encryption {operation} failed" in s
+        if reason:
+            assert reason in s
+
+
+class TestHashValidationError:
+    """Test hash validation error formatting."""
+
+    def test_hash_validation_error_displays_hex(self) -> None:
+        """Test hashes are rendered as zero-padded hex."""
+        exc = HashValidationError(P_TEST_PACKAGE, 0xFF, 0x100)
+        s = str(exc)
+
+        assert exc.expected_hash == 0xFF
+        assert "Expected: 000000FF, Got: 00000100" in s
+
+
+@pytest.mark.parametrize(
+    "factory,hint_pattern",
+    [
+        (lambda: ModScanError(P_TEST, "x"), re.compile("check file integrity", re.I)),
+        (lambda: DeployError("validate"), re.compile("backup", re.I)),
+        (lambda: BackupError(reason="x"), re.compile("disk space", re.I)),
+        (lambda: SecurityError(threat_type="x"), re.compile("malware", re.I)),
+        (
+            lambda: GameProcessError(process_name="TS4_x64.exe", reason="x"),
+            re.compile("manually", re.I),
+        ),
+        (lambda: PathError(path=P_TEST, reason="x"), re.compile("configure", re.I)),
+        (lambda: LoadOrderError("x"), re.compile("configuration", re.I)),
+        (lambda: ConflictError("0x0", ["A", "B"]), re.compile("load order", re.I)),
+        (lambda: EncryptionError("encrypt"), re.compile("key", re.I)),
+        (lambda: HashValidationError(P_TEST, 1, 2), re.compile("re-download", re.I)),
+    ],
+    ids=[
+        "ModScanError",
+        "DeployError",
+        "BackupError",
+        "SecurityError",
+        "GameProcessError",
+        "PathError",
+        "LoadOrderError",
+        "ConflictError",
+        "EncryptionError",
+        "HashValidationError",
+    ],
+)
+def test_default_recovery_hint(
+    factory: Callable[[], ModManagerException], hint_pattern: re.Pattern[str]
+) -> None:
+    """Test every exception falls back to a useful recovery hint."""
+    exc = factory()
+
+    assert f"\nSuggestion: {exc.recovery_hint}" in str(exc)
+    assert hint_pattern.search(exc.recovery_hint)
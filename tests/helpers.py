@@ -0,0 +1,68 @@
+"""Plain helpers and stubs shared by test modules.
+
+Kept out of conftest.py so test modules can import them directly; the
+fixtures that wrap them stay in conftest.py.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable
+
+
+def bulk_create_files(files: dict[Path, bytes], dirs: Iterable[Path] = ()) -> None:
+    """Create test directories and small files in one pass.
+
+    Each distinct parent directory is created once, and files are written
+    with a raw open/write/close instead of Path.write_bytes.
+
+    Args:
+        files: Mapping of file path to contents
+        dirs: Extra (possibly empty) directories to create
+    """
+    for directory in {*dirs, *(path.parent for path in files)}:
+        os.makedirs(directory, exist_ok=True)
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for path, data in files.items():
+        fd = os.open(path, flags, 0o644)
+        try:
+            # os.write may write fewer bytes than asked; loop until done
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+
+class GameProcessManagerStub:
+    """Minimal stand-in for GameProcessManager used by DeployEngine.
+
+    Implements only the context manager protocol and the two methods the
+    engine calls, so tests avoid building MagicMock attribute graphs.
+
+    Attributes:
+        running: Value returned by is_game_running()
+        close_ok: Value returned by close_game_safely()
+        close_calls: Number of close_game_safely() calls
+        exit_calls: Number of __exit__() calls
+    """
+
+    def __init__(self, running: bool = False, close_ok: bool = True) -> None:
+        self.running = running
+        self.close_ok = close_ok
+        self.close_calls = 0
+        self.exit_calls = 0
+
+    def __enter__(self) -> "GameProcessManagerStub":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.exit_calls += 1
+        return False  # Don't swallow exceptions
+
+    def is_game_running(self) -> bool:
+        return self.running
+
+    def close_game_safely(self, timeout: int = 10) -> bool:
+        self.close_calls += 1
+        return self.close_ok